@@ -5,7 +5,7 @@ import os
 import random
 from typing import Optional
 
-from .protocol import make_state_from_inputs, pack, PROTOCOL_VERSION
+from .protocol import make_state_from_inputs, pack, pack_link_stats, LINK_ROLE_CLIENT, PROTOCOL_VERSION
 from .controller_profiles import get_profile
 
 # Enable joystick input even when window is not focused
@@ -57,6 +57,17 @@ class GamepadClient:
             self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
         except Exception:
             pass
+        # Input packets are tiny and latency-sensitive: ask for low-delay TOS and,
+        # on Linux, the highest unprivileged queueing priority
+        try:
+            self._sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)
+        except OSError:
+            pass
+        if hasattr(socket, 'SO_PRIORITY'):
+            try:
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, 6)
+            except OSError:
+                pass
         # Explicitly bind to let OS assign a port immediately (prevents WinError 10022 on Windows)
         # Binding is only needed on Windows; on Unix-like systems, sendto() works without bind
         import platform
@@ -198,9 +209,9 @@ class GamepadClient:
             import statistics
             jitter_ms = statistics.stdev(self._latency_samples)
         else:
-            jitter_ms = 0.0
+            jitter_ms = float('nan')  # not measurable from one sample
         
         # Report telemetry every second
         if current_time - self._last_telemetry_time >= 1.0:
-            self.telemetry_cb(f'Latency: {latency_ms:.1f}ms | Jitter: {jitter_ms:.1f}ms | Rate: {self.update_rate}Hz | seq={self._seq}')
+            self.telemetry_cb(pack_link_stats(LINK_ROLE_CLIENT, latency_ms, jitter_ms, self.update_rate, self._seq))
             self._last_telemetry_time = current_time
@@ -463,6 +463,9 @@ CONTROLLER_PROFILES = {
     'switch_pro': NintendoSwitchProControllerProfile(),
 }
 
+# Display name -> profile key, for the Settings dropdown
+_PROFILE_KEYS_BY_NAME = {profile.name: key for key, profile in CONTROLLER_PROFILES.items()}
+
 
 def get_profile(profile_name):
     """
@@ -497,7 +500,4 @@ def get_profile_by_display_name(display_name):
     Returns:
         str: The profile key, or 'generic' if not found
     """
-    for key, profile in CONTROLLER_PROFILES.items():
-        if profile.name == display_name:
-            return key
-    return 'generic'
+    return _PROFILE_KEYS_BY_NAME.get(display_name, 'generic')
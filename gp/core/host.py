@@ -4,7 +4,10 @@ import time
 import random
 from typing import Optional, Dict, Any
 
-from .protocol import unpack, PROTOCOL_VERSION
+from .protocol import (
+    unpack, pack_player_stats, pack_player_event, pack_link_stats, PROTOCOL_VERSION, MAX_PACKET_SIZE,
+    PLAYER_COLORS, TELEM_PLAYER_JOIN, TELEM_PLAYER_LEAVE, LINK_ROLE_HOST,
+)
 from .security import SecurityManager, SecurityConfig
 
 try:
@@ -24,19 +27,15 @@ _NOUNS = [
     'Hawk', 'Panther', 'Fox', 'Bear', 'Raven', 'Lynx', 'Shark',
     'Eagle', 'Lion', 'Cobra', 'Jaguar', 'Orca', 'Rex',
 ]
-_COLORS = [
-    '#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6',
-    '#1abc9c', '#e67e22', '#00bcd4', '#ff6b81', '#a29bfe',
-    '#fd79a8', '#00cec9', '#ffeaa7', '#74b9ff', '#55efc4',
-]
 
 
 def _generate_player_name() -> str:
     return f"{random.choice(_ADJECTIVES)} {random.choice(_NOUNS)}"
 
 
-def _generate_player_color() -> str:
-    return random.choice(_COLORS)
+def _generate_player_color() -> int:
+    """Random index into PLAYER_COLORS."""
+    return random.randrange(len(PLAYER_COLORS))
 
 
 MAX_CONTROLLERS = 4  # XInput hardware limit
@@ -67,7 +66,7 @@ class GamepadHost:
         self._latency_samples_single: list = []
 
         # --- Multi-controller state ---
-        # client_id -> {gamepad, last_seq, last_buttons, last_time, name, color, latency_samples, ...}
+        # client_id -> {gamepad, last_seq, last_buttons, last_time, name, color, color_idx, latency_samples, ...}
         self._clients: Dict[int, Dict[str, Any]] = {}
         self._client_slot_order: list = []  # ordered list of client_ids for slot numbering
 
@@ -116,6 +115,18 @@ class GamepadHost:
                     self.status_cb('⚠ Could not connect to ViGEmBus after all retries.')
                     self.status_cb('→ Try restarting CooPad or reinstalling ViGEmBus driver.')
 
+    def _next_free_slot(self) -> int:
+        """Lowest player slot (1..MAX_CONTROLLERS) not held by a connected client.
+
+        Callers reject new clients once MAX_CONTROLLERS are connected, so a slot
+        is always free here.
+        """
+        used = {info['slot'] for info in self._clients.values()}
+        for slot in range(1, MAX_CONTROLLERS + 1):
+            if slot not in used:
+                return slot
+        raise RuntimeError(f'no free player slot ({MAX_CONTROLLERS} clients connected)')
+
     def _get_or_create_gamepad(self, client_id: int):
         """Get existing or create new virtual gamepad for a client (multi mode)."""
         if client_id in self._clients:
@@ -126,15 +137,16 @@ class GamepadHost:
         if not VGAME_AVAILABLE:
             # Create entry without real gamepad
             name = _generate_player_name()
-            color = _generate_player_color()
-            slot = len(self._clients) + 1
+            color_idx = _generate_player_color()
+            slot = self._next_free_slot()
             self._clients[client_id] = {
                 'gamepad': None,
                 'last_seq': None,
                 'last_buttons': 0,
                 'last_time': time.time(),
                 'name': name,
-                'color': color,
+                'color': PLAYER_COLORS[color_idx],
+                'color_idx': color_idx,
                 'slot': slot,
                 'latency_samples': [],
                 'last_telemetry_time': 0,
@@ -144,7 +156,7 @@ class GamepadHost:
             }
             self._client_slot_order.append(client_id)
             self.status_cb(f'[Player {slot}] "{name}" connected (no vgamepad driver)')
-            self.telemetry_cb(f'PLAYER_JOIN|{client_id}|{name}|{color}|{slot}')
+            self.telemetry_cb(pack_player_event(TELEM_PLAYER_JOIN, client_id, slot, color_idx, name))
             return None
         try:
             gp = vg.VX360Gamepad()
@@ -152,15 +164,16 @@ class GamepadHost:
             self.status_cb(f'failed to create gamepad for client {client_id}: {e}')
             return None
         name = _generate_player_name()
-        color = _generate_player_color()
-        slot = len(self._clients) + 1
+        color_idx = _generate_player_color()
+        slot = self._next_free_slot()
         self._clients[client_id] = {
             'gamepad': gp,
             'last_seq': None,
             'last_buttons': 0,
             'last_time': time.time(),
             'name': name,
-            'color': color,
+            'color': PLAYER_COLORS[color_idx],
+            'color_idx': color_idx,
             'slot': slot,
             'latency_samples': [],
             'last_telemetry_time': 0,
@@ -170,7 +183,7 @@ class GamepadHost:
         }
         self._client_slot_order.append(client_id)
         self.status_cb(f'[Player {slot}] "{name}" connected — virtual gamepad #{slot} created')
-        self.telemetry_cb(f'PLAYER_JOIN|{client_id}|{name}|{color}|{slot}')
+        self.telemetry_cb(pack_player_event(TELEM_PLAYER_JOIN, client_id, slot, color_idx, name))
         return gp
 
     def _cleanup_stale_clients(self):
@@ -186,7 +199,8 @@ class GamepadHost:
                 except Exception:
                     pass
             self.status_cb(f'[Player {info["slot"]}] "{info["name"]}" disconnected (timeout)')
-            self.telemetry_cb(f'PLAYER_LEAVE|{cid}|{info["name"]}|{info["color"]}|{info["slot"]}')
+            self.telemetry_cb(pack_player_event(
+                TELEM_PLAYER_LEAVE, cid, info['slot'], info['color_idx'], info['name']))
             del self._clients[cid]
             if cid in self._client_slot_order:
                 self._client_slot_order.remove(cid)
@@ -216,14 +230,20 @@ class GamepadHost:
         except Exception:
             pass
         self._sock.bind((self.bind_ip, self.port))
+        # Set once: settimeout toggles the socket's blocking mode with a syscall
+        self._sock.settimeout(0.5)
 
         if not self.multi_gamepad:
             self._init_single_gamepad()
 
+        # Datagrams land in one reusable buffer; unpack() copies the fields
+        # out before the next receive overwrites it
+        buf = bytearray(MAX_PACKET_SIZE)
+        view = memoryview(buf)
+
         while not self._stop.is_set():
             try:
-                self._sock.settimeout(0.5)
-                data, addr = self._sock.recvfrom(2048)
+                nbytes, addr = self._sock.recvfrom_into(buf)
             except socket.timeout:
                 if self.multi_gamepad:
                     self._cleanup_stale_clients()
@@ -238,7 +258,7 @@ class GamepadHost:
                 continue
 
             try:
-                state = unpack(data)
+                state = unpack(view[:nbytes])
             except Exception as e:
                 self.status_cb(f'bad packet: {e}')
                 continue
@@ -393,7 +413,7 @@ class GamepadHost:
             import statistics
             jitter_ms = statistics.stdev(self._latency_samples_single)
         else:
-            jitter_ms = 0.0
+            jitter_ms = float('nan')  # not measurable from one sample
         if not hasattr(self, '_rate_start_time'):
             self._rate_start_time = current_time
             self._rate_packet_count = 0
@@ -406,10 +426,7 @@ class GamepadHost:
         else:
             rate_hz = 0
         if current_time - self._last_telemetry_time >= 1.0:
-            if rate_hz > 0:
-                self.telemetry_cb(f'Latency: {latency_ms:.1f}ms | Jitter: {jitter_ms:.1f}ms | Rate: {rate_hz:.1f}Hz | seq={state.sequence}')
-            else:
-                self.telemetry_cb(f'Latency: {latency_ms:.1f}ms | Jitter: {jitter_ms:.1f}ms | seq={state.sequence}')
+            self.telemetry_cb(pack_link_stats(LINK_ROLE_HOST, latency_ms, jitter_ms, rate_hz, state.sequence))
             self._last_telemetry_time = current_time
 
     def _update_telemetry_multi(self, state, client_id: int):
@@ -426,7 +443,7 @@ class GamepadHost:
             import statistics
             jitter_ms = statistics.stdev(info['latency_samples'])
         else:
-            jitter_ms = 0.0
+            jitter_ms = float('nan')  # not measurable from one sample
         info['rate_packet_count'] = info.get('rate_packet_count', 0) + 1
         elapsed = current_time - info.get('rate_start_time', current_time)
         if elapsed >= 1.0:
@@ -436,17 +453,8 @@ class GamepadHost:
         else:
             rate_hz = 0
         if current_time - info.get('last_telemetry_time', 0) >= 1.0:
-            slot = info['slot']
-            name = info['name']
-            color = info['color']
-            if rate_hz > 0:
-                self.telemetry_cb(
-                    f'PLAYER_STATS|{client_id}|{name}|{color}|{slot}|'
-                    f'{latency_ms:.1f}|{jitter_ms:.1f}|{rate_hz:.1f}|{state.sequence}')
-            else:
-                self.telemetry_cb(
-                    f'PLAYER_STATS|{client_id}|{name}|{color}|{slot}|'
-                    f'{latency_ms:.1f}|{jitter_ms:.1f}|0|{state.sequence}')
+            self.telemetry_cb(pack_player_stats(
+                client_id, info['slot'], latency_ms, jitter_ms, rate_hz, state.sequence))
             info['last_telemetry_time'] = current_time
     
     def get_security_stats(self) -> dict:
@@ -74,11 +74,12 @@ def pack(state: GamepadState) -> bytes:
 
 
 def unpack(data: bytes) -> GamepadState:
+    """Decode a packet from any bytes-like object (bytes, bytearray, memoryview)."""
     if not validate_packet_size(data):
         raise ValueError(f'invalid packet size: {len(data)} bytes')
     if len(data) < PACKET_SIZE:
         raise ValueError('packet too small')
-    vals = struct.unpack(PACKET_FMT, data[:PACKET_SIZE])
+    vals = struct.unpack_from(PACKET_FMT, data)
     state = GamepadState(*vals)
     if not validate_gamepad_state(state):
         raise ValueError('invalid gamepad state values')
@@ -99,3 +100,61 @@ def make_state_from_inputs(client_id: int, seq: int, buttons: int, lt: int, rt:
         ry=int(ry),
         timestamp=time.perf_counter_ns(),
     )
+
+
+# Host -> UI telemetry frames. Byte 0 is the frame kind; the rest is a fixed
+# little-endian layout so the UI can decode it with a single unpack_from.
+TELEM_PLAYER_STATS = 0x01
+TELEM_PLAYER_JOIN = 0x02
+TELEM_PLAYER_LEAVE = 0x03
+TELEM_LINK_STATS = 0x04
+PLAYER_STATS_FMT = '<B I B f f f H'  # kind, client_id, slot, latency_ms, jitter_ms (NaN = not measured), rate_hz, seq
+PLAYER_STATS_STRUCT = struct.Struct(PLAYER_STATS_FMT)
+PLAYER_EVENT_FMT = '<B I B B'  # kind, client_id, slot, color index; UTF-8 player name follows
+PLAYER_EVENT_STRUCT = struct.Struct(PLAYER_EVENT_FMT)
+LINK_STATS_FMT = '<B B f f f H'  # kind, role, latency_ms, jitter_ms (NaN = not measured), rate_hz (0 = not measured yet), seq
+LINK_STATS_STRUCT = struct.Struct(LINK_STATS_FMT)
+
+# LINK_STATS roles: which side of a single-gamepad session measured the stats
+LINK_ROLE_HOST = 0
+LINK_ROLE_CLIENT = 1
+
+# Player card colors; frames carry an index into this table
+PLAYER_COLORS = (
+    '#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6',
+    '#1abc9c', '#e67e22', '#00bcd4', '#ff6b81', '#a29bfe',
+    '#fd79a8', '#00cec9', '#ffeaa7', '#74b9ff', '#55efc4',
+)
+
+
+def pack_player_stats(client_id: int, slot: int, latency_ms: float, jitter_ms: float,
+                      rate_hz: float, seq: int) -> bytes:
+    return PLAYER_STATS_STRUCT.pack(
+        TELEM_PLAYER_STATS, client_id, slot, latency_ms, jitter_ms, rate_hz, seq & 0xFFFF)
+
+
+def unpack_player_stats(frame: bytes) -> tuple:
+    """Return (client_id, slot, latency_ms, jitter_ms, rate_hz, seq) from a PLAYER_STATS frame."""
+    return PLAYER_STATS_STRUCT.unpack_from(frame)[1:]
+
+
+def pack_link_stats(role: int, latency_ms: float, jitter_ms: float, rate_hz: float, seq: int) -> bytes:
+    """Build a LINK_STATS frame (single-gamepad host or client telemetry)."""
+    return LINK_STATS_STRUCT.pack(TELEM_LINK_STATS, role, latency_ms, jitter_ms, rate_hz, seq & 0xFFFF)
+
+
+def unpack_link_stats(frame: bytes) -> tuple:
+    """Return (role, latency_ms, jitter_ms, rate_hz, seq) from a LINK_STATS frame."""
+    return LINK_STATS_STRUCT.unpack_from(frame)[1:]
+
+
+def pack_player_event(kind: int, client_id: int, slot: int, color_idx: int, name: str) -> bytes:
+    """Build a PLAYER_JOIN / PLAYER_LEAVE frame."""
+    return PLAYER_EVENT_STRUCT.pack(kind, client_id, slot, color_idx) + name.encode('utf-8')
+
+
+def unpack_player_event(frame: bytes) -> tuple:
+    """Return (client_id, slot, color_idx, name) from a PLAYER_JOIN / PLAYER_LEAVE frame."""
+    _, client_id, slot, color_idx = PLAYER_EVENT_STRUCT.unpack_from(frame)
+    name = frame[PLAYER_EVENT_STRUCT.size:].decode('utf-8', 'replace')
+    return client_id, slot, color_idx, name
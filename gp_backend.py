@@ -3,9 +3,11 @@ import time
 import random
 from typing import Callable, Optional
 
+from gp.core.protocol import pack_link_stats, LINK_ROLE_HOST, LINK_ROLE_CLIENT
+
 
 class BaseRunner:
-    def __init__(self, status_cb: Callable[[str], None], telemetry_cb: Callable[[str], None]):
+    def __init__(self, status_cb: Callable[[str], None], telemetry_cb: Callable[[bytes], None]):
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self.status_cb = status_cb
@@ -34,19 +36,23 @@ class DummyHost(BaseRunner):
         while not self._stop_event.is_set():
             time.sleep(0.5)
             latency = random.uniform(1.0, 8.0)
-            self.telemetry_cb(f"Latency: {latency:.1f} ms | seq={seq}")
+            self.telemetry_cb(pack_link_stats(LINK_ROLE_HOST, latency, float('nan'), 2.0, seq))
             seq = (seq + 1) & 0xFFFF
         self.status_cb("Host: stopped")
 
 
 class DummyClient(BaseRunner):
+    def __init__(self, status_cb, telemetry_cb, parent):
+        super().__init__(status_cb, telemetry_cb)
+        self.parent = parent
+
     def _run(self):
         self.status_cb("Client: starting (dummy)")
         seq = 0
         while not self._stop_event.is_set():
             time.sleep(0.25)
             latency = random.uniform(0.5, 6.0)
-            self.telemetry_cb(f"Sent seq={seq} | rtt~{latency:.1f} ms")
+            self.telemetry_cb(pack_link_stats(LINK_ROLE_CLIENT, latency, float('nan'), self.parent.update_rate, seq))
             seq = (seq + 1) & 0xFFFF
         self.status_cb("Client: stopped")
 
@@ -66,7 +72,7 @@ def _try_import_real():
 
 
 class GpController:
-    def __init__(self, status_cb: Callable[[str], None], telemetry_cb: Callable[[str], None]):
+    def __init__(self, status_cb: Callable[[str], None], telemetry_cb: Callable[[bytes], None]):
         self.status_cb = status_cb
         self.telemetry_cb = telemetry_cb
         self.update_rate = 60  # Default update rate in Hz
@@ -144,15 +150,15 @@ class GpController:
                         inner_self.status_cb(f"✗ Client error: {e}")
 
             # wrap callbacks to prefix messages with source
-            self._host = RealHost(lambda t: status_cb(f"HOST|{t}"), lambda t: telemetry_cb(f"HOST|{t}"), self)
-            self._client = RealClient(lambda t: status_cb(f"CLIENT|{t}"), lambda t: telemetry_cb(f"CLIENT|{t}"), self)
+            self._host = RealHost(lambda t: status_cb(f"HOST|{t}"), telemetry_cb, self)
+            self._client = RealClient(lambda t: status_cb(f"CLIENT|{t}"), telemetry_cb, self)
         else:
             if error:
                 status_cb(f"⚠ {error}")
             status_cb("Using demo mode - Real gamepad functionality not available")
             status_cb("→ Check platform_help for setup instructions")
-            self._host = DummyHost(lambda t: status_cb(f"HOST|{t}"), lambda t: telemetry_cb(f"HOST|{t}"))
-            self._client = DummyClient(lambda t: status_cb(f"CLIENT|{t}"), lambda t: telemetry_cb(f"CLIENT|{t}"))
+            self._host = DummyHost(lambda t: status_cb(f"HOST|{t}"), telemetry_cb)
+            self._client = DummyClient(lambda t: status_cb(f"CLIENT|{t}"), telemetry_cb, self)
 
     def start_host(self):
         self._host.start()
@@ -3,6 +3,8 @@ import sys
 import threading
 import time
 import json
+import math
+import struct
 try:
     import tkinter as tk
     from tkinter import ttk, messagebox
@@ -11,46 +13,152 @@ except ImportError:
     sys.exit(1)
 
 
-from PIL import Image, ImageOps, ImageTk
-from gp_backend import GpController
+# PIL and gp_backend are imported lazily where needed to keep cold start fast
 from platform_info import get_platform_info
-import socket
-from queue import Queue
+from gp.core.protocol import (
+    PLAYER_COLORS, TELEM_LINK_STATS, TELEM_PLAYER_JOIN, TELEM_PLAYER_LEAVE, TELEM_PLAYER_STATS,
+    unpack_link_stats, unpack_player_event, unpack_player_stats,
+)
+from gp.core.controller_profiles import get_profile_by_display_name, get_profile_names
+from collections import deque
 import logging
 
+# --- Asset paths (resolved once at import) ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMG_DIR = os.path.join(BASE_DIR, 'img')
+ICO_PATH = os.path.join(IMG_DIR, 'src_CooPad.ico')
+PNG_PATH = os.path.join(IMG_DIR, 'src_CooPad.png')
+LOGO_PATH = os.path.join(IMG_DIR, 'src_CooPad_140.png')
+
 # --- Config file helpers ---
 CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.coopad')
 CONFIG_PATH = os.path.join(CONFIG_DIR, 'settings.json')
+LOGO_CACHE_PATH = os.path.join(CONFIG_DIR, 'logo_140.png')
+# Explicit buffer so settings I/O is a single read()/write() regardless of st_blksize
+CONFIG_BUFFER_SIZE = 128 * 1024
+
+# Serialized form of what is currently on disk; lets save_config skip no-op writes
+_config_on_disk = None
 
 def load_config() -> dict:
     """Load saved settings from disk. Returns empty dict on first run."""
+    global _config_on_disk
     try:
-        if os.path.exists(CONFIG_PATH):
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        with open(CONFIG_PATH, 'rb', buffering=CONFIG_BUFFER_SIZE) as f:
+            blob = f.read()
+        cfg = json.loads(blob)
+        _config_on_disk = blob
+        return cfg
     except Exception:
         pass
     return {}
 
 def save_config(cfg: dict):
-    """Persist settings to disk."""
+    """Persist settings to disk (atomically, and only when they changed)."""
+    global _config_on_disk
     try:
+        blob = json.dumps(cfg, indent=2).encode('utf-8')
+        if blob == _config_on_disk:
+            return
         os.makedirs(CONFIG_DIR, exist_ok=True)
-        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-            json.dump(cfg, f, indent=2)
+        tmp_path = CONFIG_PATH + '.tmp'
+        with open(tmp_path, 'wb', buffering=CONFIG_BUFFER_SIZE) as f:
+            f.write(blob)
+        os.replace(tmp_path, CONFIG_PATH)
+        _config_on_disk = blob
     except Exception:
         pass
 
 
-# Global queue for input states
-input_queue = Queue()
+def _profile_key_for(display_name: str) -> str:
+    """Controller profile key for a Settings display name; 'generic' if unknown."""
+    return get_profile_by_display_name(display_name)
+
+
+# Global queue for backend -> UI events; deque append/popleft are atomic. Left
+# unbounded: lifecycle events (backend bound, stopped, player join/leave) share
+# it with telemetry and must never be dropped
+input_queue = deque()
+
+# Backend -> UI poll cadence where Tk has no file handlers (Windows): fast while
+# events are flowing, backing off to idle. Elsewhere a socketpair wakes Tk instead
+UI_POLL_BUSY_MS = 5
+UI_POLL_IDLE_MS = 100
+
+# Sidebar logo size; img/src_CooPad_140.png ships pre-resized to this
+LOGO_SIZE = (140, 140)
+
+# Player slots shown in the Monitor tab (XInput supports at most 4 controllers)
+MAX_PLAYERS = 4
+
+# Monitor event log tag for each entry of PLAYER_COLORS
+PLAYER_LOG_TAGS = tuple(f'c_{color[1:]}' for color in PLAYER_COLORS)
+
+# Seconds cached platform status is trusted; the UI asking for it after that
+# re-detects capabilities in the background (picks up drivers installed meanwhile)
+PLATFORM_STATUS_TTL = 5.0
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+# Monitor player cards repaint at most this often (~30 FPS)
+MONITOR_REFRESH_MS = 33
+
+# Log Text widgets keep at most this many lines; older lines are dropped
+MAX_LOG_LINES = 2000
+
+# Pending log lines are written to their Text widgets at most this often (10 Hz)
+LOG_FLUSH_MS = 100
+
+# About tab body, inserted into its Text widget in one call
+ABOUT_TEXT = '''CooPad - Remote Gamepad over Network
+
+Version: 1.0.2
+License: Open Source
+
+CooPad allows you to use a gamepad over a network connection. The client captures gamepad inputs and sends them to the host, which creates a virtual gamepad that games can use.
+
+Features:
+• Windows support for Host and Client modes
+• Low latency gameplay
+• Configurable update rates
+• Controller profile selection (PS4, PS5, Xbox 360, Nintendo Switch)
+• Real-time network statistics
+• Automatic platform detection
+
+Network Requirements:
+• Both devices on same LAN, or
+• Connected via VPN (ZeroTier, Tailscale, etc.)
+• UDP port 7777 must be accessible
+
+For setup help, click the "Platform Help" button.
+'''
+
+# Fonts shared by all widgets (None = Tk default family)
+FONT_8 = (None, 8)
+FONT_9 = (None, 9)
+FONT_9_B = (None, 9, 'bold')
+FONT_10 = (None, 10)
+FONT_10_B = (None, 10, 'bold')
+FONT_11_B = (None, 11, 'bold')
+FONT_12 = (None, 12)
+FONT_12_B = (None, 12, 'bold')
+FONT_14_B = (None, 14, 'bold')
+FONT_18_B = (None, 18, 'bold')
+FONT_MONO = ('Consolas', 10)
+FONT_UI_8_B = ('Segoe UI', 8, 'bold')
+FONT_UI_10 = ('Segoe UI', 10)
+FONT_UI_10_B = ('Segoe UI', 10, 'bold')
+FONT_UI_11 = ('Segoe UI', 11)
+FONT_UI_13_B = ('Segoe UI', 13, 'bold')
+FONT_UI_14_B = ('Segoe UI', 14, 'bold')
+
+# Configure logging; a plain HH:MM:SS datefmt skips the default millisecond
+# formatting done for every record
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s', datefmt='%H:%M:%S'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
-# Get platform info on startup
-platform_info = get_platform_info()
+# Sidebar host/client indicator shown until the first platform probe lands
+PLATFORM_PENDING_STATUS = {'icon': '…', 'color': '#888888', 'message': 'Checking platform support...'}
 
 
 class App(tk.Tk):
@@ -59,32 +167,31 @@ class App(tk.Tk):
         self.title("CooPad — Remote Gamepad")
         self.geometry("1100x750")
 
+        # Sidebar logo, decoded once; also the window icon outside Windows
+        self._logo_img = self._load_logo()
+
         # icon - handle cross-platform icon loading
-        base = os.path.dirname(__file__)
         try:
             if sys.platform == 'win32':
-                # Windows can use .ico files directly
-                ico_path = os.path.join(base, "img", "src_CooPad.ico")
-                if os.path.exists(ico_path):
-                    self.wm_iconbitmap(ico_path)
-            else:
-                # Other platforms - use PNG with iconphoto
-                png_path = os.path.join(base, "img", "src_CooPad.png")
-                if os.path.exists(png_path):
-                    icon_img = Image.open(png_path)
-                    icon_photo = ImageTk.PhotoImage(icon_img)
-                    self.iconphoto(True, icon_photo)
-        except Exception:
+                # Windows can use .ico files directly; a missing file raises TclError
+                self.wm_iconbitmap(ICO_PATH)
+            elif self._logo_img is not None:
+                # Other platforms - reuse the 140px logo with iconphoto
+                self.iconphoto(True, self._logo_img)
+        except tk.TclError:
             pass
 
         # style
         self.style = ttk.Style(self)
         try:
             self.style.theme_use('clam')
-        except Exception:
+        except tk.TclError:
             pass
+        # Shared label styles, so each font spec is parsed once per style
+        self.style.configure('Section.TLabel', font=FONT_12_B)
+        self.style.configure('Field.TLabel', font=FONT_10_B)
+        self.style.configure('Hint.TLabel', font=FONT_9, foreground='#888888')
 
-        self._mono_font = ("Consolas", 10)
         
         # Color palette for consistent styling
         self._palette = {
@@ -95,25 +202,71 @@ class App(tk.Tk):
             'text_fg': '#e6e6e6',
             'entry_bg': '#1a1c1d',
             'button_bg': '#2a7bd6',
-            'accent': '#2a7bd6'
+            'accent': '#2a7bd6',
+            'top_bar': '#000000'
         }
 
-        # controller (backend)
-        self._gp = GpController(status_cb=self._append_status, telemetry_cb=self._set_telemetry)
+        # Platform name/status dicts, filled by the startup probe (_refresh_platform_status)
+        self._plat_cache = None
+        # time.monotonic() of the last probe started, for PLATFORM_STATUS_TTL
+        self._plat_probe_time = 0.0
+        # Rendered Platform Help text, built on first open and dropped when the status changes
+        self._help_content = None
+
+        # Log lines waiting to be written, per Text widget, flushed on the next LOG_FLUSH_MS tick
+        self._pending_logs = {}
+        self._logs_scheduled = False
+        # Lines currently held by each log widget, so trimming needs no index query
+        self._log_lines = {}
+        # Monitor event log timestamp, reformatted only when the second changes
+        self._log_ts_sec = 0
+        self._log_ts = ''
+
+        # Latest telemetry text per label, applied in one batch on the next idle tick
+        self._pending_telem = {}
+        self._telem_scheduled = False
+
+        # controller (backend) - constructed on a worker thread, see _init_backend
+        self._gp = None
 
         # Load saved config (or empty dict on first run)
         self._config = load_config()
         self._settings_confirmed = self._config.get('settings_confirmed', False)
 
-        # Restore saved settings into backend
-        saved_rate = self._config.get('update_rate', 60)
-        saved_profile = self._config.get('controller_profile', 'generic')
-        self._gp.set_update_rate(saved_rate)
-        self._gp.set_controller_profile(saved_profile)
-
         # build UI
         self._build_ui()
 
+        # start draining backend events on the Tk thread: woken by _post where
+        # Tk supports file handlers, polled otherwise
+        self._wake_r = self._wake_w = None
+        self._wake_pending = False
+        if not self._init_wakeup():
+            self._poll_interval = UI_POLL_IDLE_MS
+            self.after(self._poll_interval, self._poll_ui)
+
+        # Importing gp.core and probing the drivers can take a while, so the
+        # backend and the platform status are created off the Tk thread while
+        # the window comes up
+        threading.Thread(target=self._init_backend, daemon=True).start()
+        self._refresh_platform_status(recheck=False)
+
+    def _init_backend(self) -> None:
+        """Worker thread: build the GpController and hand it to the Tk thread."""
+        from gp_backend import GpController
+        gp = GpController(status_cb=self._post_status, telemetry_cb=self._post_telemetry)
+        self._post(self._bind_backend, gp)
+
+    def _bind_backend(self, gp) -> None:
+        """Attach the backend, push the current settings into it and unlock Start."""
+        self._gp = gp
+        gp.set_update_rate(self.update_rate_var.get())
+        gp.set_multi_gamepad(self._multi_gp_var.get())
+        gp.set_controller_profile(_profile_key_for(self.controller_profile_var.get()))
+        self.host_btn.config(state='normal')
+        self.client_btn.config(state='normal')
+        if self._settings_built:
+            self._confirm_btn.config(state='normal')
+
     def _build_ui(self):
         container = ttk.Frame(self)
         container.pack(fill='both', expand=True, padx=12, pady=12)
@@ -123,19 +276,13 @@ class App(tk.Tk):
         left.pack(side='left', fill='y', padx=(0,12), pady=6)
 
         # logo
-        logo_path = os.path.join(os.path.dirname(__file__), 'img', 'src_CooPad.png')
-        if os.path.exists(logo_path):
-            try:
-                img = Image.open(logo_path).convert('RGBA')
-                img = ImageOps.fit(img, (140, 140), Image.LANCZOS)
-                tk_img = ImageTk.PhotoImage(img)
-                logo_label = ttk.Label(left, image=tk_img)
-                logo_label.image = tk_img
-                logo_label.pack(pady=(12,6))
-            except Exception:
-                ttk.Label(left, text='CooPad', font=(None, 18, 'bold')).pack(pady=18)
+        tk_img = self._logo_img
+        if tk_img is not None:
+            logo_label = ttk.Label(left, image=tk_img)
+            logo_label.image = tk_img
+            logo_label.pack(pady=(12,6))
         else:
-            ttk.Label(left, text='CooPad', font=(None, 18, 'bold')).pack(pady=18)
+            ttk.Label(left, text='CooPad', font=FONT_18_B).pack(pady=18)
 
         ttk.Label(left, text='Remote Gamepad').pack(pady=(0,12))
         
@@ -143,38 +290,38 @@ class App(tk.Tk):
         status_frame = tk.Frame(left, bg='#1a1d1f', relief='solid', borderwidth=1)
         status_frame.pack(fill='x', padx=12, pady=(0,12))
         
-        # Platform name
-        platform_name = platform_info.get_platform_name()
-        ttk.Label(status_frame, text=f'Platform: {platform_name}', 
-                  font=(None, 9, 'bold')).pack(anchor='w', padx=8, pady=(8,4))
+        # Filled in by _apply_platform_status once the background probe finishes
+        self._platform_name_label = ttk.Label(status_frame, text='Platform: …',
+                                              font=FONT_9_B)
+        self._platform_name_label.pack(anchor='w', padx=8, pady=(8,4))
         
         # Host status indicator
-        host_status = platform_info.get_host_status()
+        host_status = PLATFORM_PENDING_STATUS
         host_indicator = tk.Frame(status_frame, bg='#1a1d1f')
         host_indicator.pack(fill='x', padx=8, pady=2)
         
         self.host_status_icon = tk.Label(host_indicator, text=host_status['icon'], 
-                                         font=(None, 12), fg=host_status['color'],
+                                         font=FONT_12, fg=host_status['color'],
                                          bg='#1a1d1f', width=2)
         self.host_status_icon.pack(side='left')
         
         self.host_status_label = tk.Label(host_indicator, text=host_status['message'],
-                                          font=(None, 8), fg='#e5e7eb',
+                                          font=FONT_8, fg='#e5e7eb',
                                           bg='#1a1d1f', anchor='w', justify='left')
         self.host_status_label.pack(side='left', fill='x', expand=True)
         
         # Client status indicator
-        client_status = platform_info.get_client_status()
+        client_status = PLATFORM_PENDING_STATUS
         client_indicator = tk.Frame(status_frame, bg='#1a1d1f')
         client_indicator.pack(fill='x', padx=8, pady=(2,8))
         
         self.client_status_icon = tk.Label(client_indicator, text=client_status['icon'],
-                                           font=(None, 12), fg=client_status['color'],
+                                           font=FONT_12, fg=client_status['color'],
                                            bg='#1a1d1f', width=2)
         self.client_status_icon.pack(side='left')
         
         self.client_status_label = tk.Label(client_indicator, text=client_status['message'],
-                                            font=(None, 8), fg='#e5e7eb',
+                                            font=FONT_8, fg='#e5e7eb',
                                             bg='#1a1d1f', anchor='w', justify='left')
         self.client_status_label.pack(side='left', fill='x', expand=True)
 
@@ -185,8 +332,8 @@ class App(tk.Tk):
         # Host controls
         hc = self.host_controls
         hc.pack(fill='x', padx=12)
-        ttk.Label(hc, text='Host Controls', font=(None, 10, 'bold')).pack(anchor='w', padx=8, pady=(6,2))
-        self.host_btn = ttk.Button(hc, text='Start Host', command=self._toggle_host)
+        ttk.Label(hc, text='Host Controls', style='Field.TLabel').pack(anchor='w', padx=8, pady=(6,2))
+        self.host_btn = ttk.Button(hc, text='Start Host', command=self._toggle_host, state='disabled')
         self.host_btn.pack(fill='x', pady=(6,6), padx=8)
         self.host_state_label = ttk.Label(hc, text='Host: stopped', foreground='#b22222')
         self.host_state_label.pack(anchor='w', padx=8, pady=(0,6))
@@ -194,7 +341,7 @@ class App(tk.Tk):
         # Client controls
         cc = self.client_controls
         cc.pack(fill='x', padx=12)
-        ttk.Label(cc, text='Client Controls', font=(None, 10, 'bold')).pack(anchor='w', padx=8, pady=(6,2))
+        ttk.Label(cc, text='Client Controls', style='Field.TLabel').pack(anchor='w', padx=8, pady=(6,2))
         ttk.Label(cc, text='Target IP', anchor='w').pack(fill='x', padx=8, pady=(6,0))
         self.ip_entry = ttk.Entry(cc)
         self.ip_entry.insert(0, '127.0.0.1')
@@ -203,7 +350,7 @@ class App(tk.Tk):
         self.port_entry = ttk.Entry(cc)
         self.port_entry.insert(0, '7777')
         self.port_entry.pack(fill='x', padx=8, pady=6)
-        self.client_btn = ttk.Button(cc, text='Start Client', command=self._toggle_client)
+        self.client_btn = ttk.Button(cc, text='Start Client', command=self._toggle_client, state='disabled')
         self.client_btn.pack(fill='x', pady=(6,6), padx=8)
         self.client_state_label = ttk.Label(cc, text='Client: stopped', foreground='#b22222')
         self.client_state_label.pack(anchor='w', padx=8, pady=(0,6))
@@ -212,74 +359,38 @@ class App(tk.Tk):
         ttk.Button(left, text='Platform Help', command=self._show_platform_help).pack(fill='x', pady=(0,12), padx=12)
 
         # initially show host controls only
-        try:
-            self.client_controls.pack_forget()
-        except Exception:
-            pass
+        self.client_controls.pack_forget()
 
         # right area
         right = ttk.Frame(container)
         right.pack(side='left', fill='both', expand=True, pady=6)
 
         # top black bar
-        top_bar = tk.Frame(right, height=56, bg='#000000')
+        top_bar = tk.Frame(right, height=56, bg=self._palette['top_bar'])
         top_bar.pack(fill='x', padx=0, pady=(0,8))
-        self._top_bar = top_bar
 
-        self._header_label = ttk.Label(top_bar, text='CooPad Remote — Dashboard', font=(None, 14, 'bold'))
+        self._header_label = ttk.Label(top_bar, text='CooPad Remote — Dashboard', font=FONT_14_B)
         self._header_label.pack(side='left', padx=12)
 
-        # Compatibility info notice
-        compat_info = platform_info.get_compatibility_info()
-        if compat_info['can_host'] and compat_info['can_client']:
-            notice_text = (
-                f"✓ {compat_info['platform']} system ready for Host and Client modes. "
-                "Ensure both devices are on the same network or use VPN (ZeroTier, Tailscale)."
-            )
-            notice_fg = '#22c55e'
-        elif compat_info['can_host']:
-            notice_text = (
-                f"⚠ {compat_info['platform']} system ready for Host mode. "
-                "Client mode needs pygame installed. Click 'Platform Help' for setup instructions."
-            )
-            notice_fg = '#f59e0b'
-        elif compat_info['can_client']:
-            notice_text = (
-                f"⚠ {compat_info['platform']} system ready for Client mode. "
-                "Host mode needs virtual gamepad driver. Click 'Platform Help' for setup instructions."
-            )
-            notice_fg = '#f59e0b'
-        else:
-            notice_text = (
-                f"✗ {compat_info['platform']} system not ready. "
-                "Missing required drivers. Click 'Platform Help' for setup instructions."
-            )
-            notice_fg = '#ef4444'
-        
-        notice = tk.Label(right, text=notice_text, wraplength=760, justify='left',
-                         fg=notice_fg, bg=self._palette['frame'], font=(None, 9))
-        notice.pack(anchor='nw', padx=12, pady=(0,8))
+        # Compatibility info notice, filled in by _apply_platform_status
+        self._compat_notice = tk.Label(right, text='Checking platform compatibility...',
+                                       wraplength=760, justify='left', fg='#888888',
+                                       bg=self._palette['frame'], font=FONT_9)
+        self._compat_notice.pack(anchor='nw', padx=12, pady=(0,8))
 
         # custom tab buttons
-        tab_btn_frame = tk.Frame(top_bar, bg=top_bar['bg'])
+        tab_btn_frame = tk.Frame(top_bar, bg=self._palette['top_bar'])
         tab_btn_frame.pack(side='right', padx=8)
         self._tab_buttons = {}
         self._tab_active = 'Host'
 
         def make_tab_button(name):
-            b = tk.Button(
+            # Colors come from the Tab.TButton style; _show_tab only flips the 'selected' state
+            b = ttk.Button(
                 tab_btn_frame,
                 text=name,
-                bd=0,
-                bg=top_bar['bg'],
-                fg='#bbbbbb',
-                activebackground='#111111',
-                activeforeground='#ffffff',
-                padx=18,
-                pady=10,
-                font=('Segoe UI', 10, 'bold'),
-                relief='flat',
-                highlightthickness=0,
+                style='Tab.TButton',
+                takefocus=False,
                 cursor='hand2'
             )
             b.pack(side='left', padx=(8,0))
@@ -302,87 +413,143 @@ class App(tk.Tk):
         self._content_frames = {'Host': host_tab, 'Client': client_tab, 'Monitor': monitor_tab, 'Settings': settings_tab}
 
         # Host content
-        ttk.Label(host_tab, text='Host Status', font=(None, 12, 'bold')).pack(anchor='nw', padx=8, pady=(8,4))
-        self.host_latency_var = tk.StringVar(value='Latency: — ms')
-        ttk.Label(host_tab, textvariable=self.host_latency_var).pack(anchor='nw', padx=8, pady=4)
-        self.host_jitter_var = tk.StringVar(value='Jitter: — ms')
-        ttk.Label(host_tab, textvariable=self.host_jitter_var).pack(anchor='nw', padx=8, pady=4)
-        self.host_packets_var = tk.StringVar(value='Packets: —')
-        ttk.Label(host_tab, textvariable=self.host_packets_var).pack(anchor='nw', padx=8, pady=4)
+        ttk.Label(host_tab, text='Host Status', style='Section.TLabel').pack(anchor='nw', padx=8, pady=(8,4))
+        # Telemetry labels are written directly by _flush_telem (no StringVar round-trip)
+        self.host_latency_label = ttk.Label(host_tab, text='Latency: — ms')
+        self.host_latency_label.pack(anchor='nw', padx=8, pady=4)
+        self.host_jitter_label = ttk.Label(host_tab, text='Jitter: — ms')
+        self.host_jitter_label.pack(anchor='nw', padx=8, pady=4)
+        self.host_packets_label = ttk.Label(host_tab, text='Packets: —')
+        self.host_packets_label.pack(anchor='nw', padx=8, pady=4)
+        self._host_tlabels = (self.host_latency_label, self.host_jitter_label, self.host_packets_label)
         ttk.Label(host_tab, text='Host Log', anchor='w').pack(fill='x', padx=8, pady=(8,0))
-        self.host_box = tk.Text(host_tab, wrap='word', height=10, font=self._mono_font)
+        self.host_box = tk.Text(host_tab, wrap='word', height=10, font=FONT_MONO)
         self.host_box.pack(fill='both', expand=True, padx=8, pady=8)
         self.host_box.config(state='disabled')
 
         # Client content
-        ttk.Label(client_tab, text='Client Status', font=(None, 12, 'bold')).pack(anchor='nw', padx=8, pady=(8,4))
-        self.client_latency_var = tk.StringVar(value='Latency: — ms')
-        ttk.Label(client_tab, textvariable=self.client_latency_var).pack(anchor='nw', padx=8, pady=4)
-        self.client_jitter_var = tk.StringVar(value='Jitter: — ms')
-        ttk.Label(client_tab, textvariable=self.client_jitter_var).pack(anchor='nw', padx=8, pady=4)
-        self.client_packets_var = tk.StringVar(value='Packets: —')
-        ttk.Label(client_tab, textvariable=self.client_packets_var).pack(anchor='nw', padx=8, pady=4)
+        ttk.Label(client_tab, text='Client Status', style='Section.TLabel').pack(anchor='nw', padx=8, pady=(8,4))
+        # Telemetry labels are written directly by _flush_telem (no StringVar round-trip)
+        self.client_latency_label = ttk.Label(client_tab, text='Latency: — ms')
+        self.client_latency_label.pack(anchor='nw', padx=8, pady=4)
+        self.client_jitter_label = ttk.Label(client_tab, text='Jitter: — ms')
+        self.client_jitter_label.pack(anchor='nw', padx=8, pady=4)
+        self.client_packets_label = ttk.Label(client_tab, text='Packets: —')
+        self.client_packets_label.pack(anchor='nw', padx=8, pady=4)
+        self._client_tlabels = (self.client_latency_label, self.client_jitter_label, self.client_packets_label)
         ttk.Label(client_tab, text='Client Log', anchor='w').pack(fill='x', padx=8, pady=(8,0))
-        self.client_box = tk.Text(client_tab, wrap='word', height=10, font=self._mono_font)
+        self.client_box = tk.Text(client_tab, wrap='word', height=10, font=FONT_MONO)
         self.client_box.pack(fill='both', expand=True, padx=8, pady=8)
         self.client_box.config(state='disabled')
 
+        # Message prefix routing for _append_status
+        self._status_boxes = {'HOST': self.host_box, 'CLIENT': self.client_box}
+        # LINK_STATS role (LINK_ROLE_HOST / LINK_ROLE_CLIENT) -> label triple
+        self._telem_labels = (self._host_tlabels, self._client_tlabels)
+        # Binary telemetry frames (gp.core.protocol): kind byte -> (decoder, handler)
+        self._frame_handlers = {
+            TELEM_PLAYER_STATS: (unpack_player_stats, self._handle_player_stats),
+            TELEM_PLAYER_JOIN: (unpack_player_event, self._handle_player_join),
+            TELEM_PLAYER_LEAVE: (unpack_player_event, self._handle_player_leave),
+            TELEM_LINK_STATS: (unpack_link_stats, self._handle_link_stats),
+        }
+
         # ======== Monitor tab (multi-gamepad player dashboard) ========
         monitor_header = tk.Frame(monitor_tab, bg='#111214')
         monitor_header.pack(fill='x', padx=0, pady=(0, 8))
-        tk.Label(monitor_header, text='\U0001f3ae  Player Monitor', font=('Segoe UI', 14, 'bold'),
+        tk.Label(monitor_header, text='\U0001f3ae  Player Monitor', font=FONT_UI_14_B,
                  fg='#ffffff', bg='#111214').pack(side='left', padx=12, pady=10)
         self._monitor_status_label = tk.Label(
-            monitor_header, text='Multi-Gamepad: OFF', font=('Segoe UI', 10),
+            monitor_header, text='Multi-Gamepad: OFF', font=FONT_UI_10,
             fg='#888888', bg='#111214')
         self._monitor_status_label.pack(side='right', padx=12, pady=10)
 
-        # Scrollable player cards area
+        # Scrollable player cards area (cards are drawn directly on the canvas)
         monitor_canvas_frame = tk.Frame(monitor_tab, bg=self._palette['frame'])
         monitor_canvas_frame.pack(fill='both', expand=True, padx=0, pady=0)
         self._monitor_canvas = tk.Canvas(monitor_canvas_frame, bg=self._palette['frame'],
                                          highlightthickness=0, bd=0)
         self._monitor_scrollbar = ttk.Scrollbar(monitor_canvas_frame, orient='vertical',
                                                  command=self._monitor_canvas.yview)
-        self._monitor_cards_frame = tk.Frame(self._monitor_canvas, bg=self._palette['frame'])
-        self._monitor_cards_frame.bind('<Configure>',
-            lambda e: self._monitor_canvas.configure(scrollregion=self._monitor_canvas.bbox('all')))
-        self._monitor_canvas.create_window((0, 0), window=self._monitor_cards_frame, anchor='nw')
         self._monitor_canvas.configure(yscrollcommand=self._monitor_scrollbar.set)
+        self._monitor_canvas.bind('<Configure>', self._on_monitor_resize)
         self._monitor_canvas.pack(side='left', fill='both', expand=True)
         self._monitor_scrollbar.pack(side='right', fill='y')
+        self._monitor_width = 760
 
-        # Empty state label
-        self._monitor_empty_label = tk.Label(
-            self._monitor_cards_frame,
+        # Empty state text
+        self._monitor_empty_item = self._monitor_canvas.create_text(
+            self._monitor_width // 2, 80,
             text='No players connected.\n\nEnable Multi-Gamepad Co-op in Settings\nand start the Host to see connected players here.',
-            font=('Segoe UI', 11), fg='#555555', bg=self._palette['frame'],
-            justify='center'
+            font=FONT_UI_11, fill='#555555', justify='center', anchor='n'
         )
-        self._monitor_empty_label.pack(expand=True, pady=80)
 
-        # Dict to track player card widgets: client_id -> {frame, name_lbl, ...}
-        self._player_cards = {}
+        # Player card canvas items in per-field tables indexed by slot - 1.
+        # All cards are drawn once, hidden; join/leave only restyle and show/hide them.
+        self._player_cids = [None] * MAX_PLAYERS
+        self._player_rects = [None] * MAX_PLAYERS
+        self._player_dot_items = [None] * MAX_PLAYERS
+        self._player_name_items = [None] * MAX_PLAYERS
+        self._player_badge_rects = [None] * MAX_PLAYERS
+        self._player_lat_items = [None] * MAX_PLAYERS
+        self._player_jit_items = [None] * MAX_PLAYERS
+        self._player_rate_items = [None] * MAX_PLAYERS
+        self._player_seq_items = [None] * MAX_PLAYERS
+        for slot in range(1, MAX_PLAYERS + 1):
+            self._draw_player_card(slot)
+        # Last rendered [(latency text, color), jitter, rate, seq] per card
+        self._player_last = [None] * MAX_PLAYERS
+        # Newest PLAYER_STATS fields per slot, painted by _flush_monitor
+        self._pending_stats = [None] * MAX_PLAYERS
+        self._monitor_dirty = False
+        self._monitor_scheduled = False
 
         # Host event log at the bottom of monitor tab
-        tk.Label(monitor_tab, text='Connection Events', font=('Segoe UI', 10, 'bold'),
+        tk.Label(monitor_tab, text='Connection Events', font=FONT_UI_10_B,
                  fg='#aaaaaa', bg=self._palette['frame'], anchor='w').pack(fill='x', padx=12, pady=(8, 2))
-        self._monitor_log = tk.Text(monitor_tab, wrap='word', height=5, font=self._mono_font,
+        self._monitor_log = tk.Text(monitor_tab, wrap='word', height=5, font=FONT_MONO,
                                      bg=self._palette['text_bg'], fg=self._palette['text_fg'])
         self._monitor_log.pack(fill='x', padx=12, pady=(0, 8))
         self._monitor_log.config(state='disabled')
+        # One color tag per player color, configured up front; events pass the tag name
+        for tag, color in zip(PLAYER_LOG_TAGS, PLAYER_COLORS):
+            self._monitor_log.tag_configure(tag, foreground=color)
+        self._monitor_log.tag_configure('dim', foreground='#888888')
+
+        # Settings state; the Settings tab widgets are built on first view
+        self.update_rate_var = tk.IntVar(value=self._config.get('update_rate', 60))
+        self.controller_profile_var = tk.StringVar(value=self._config.get('controller_profile_display', 'Generic'))
+        self._multi_gp_var = tk.BooleanVar(value=self._config.get('multi_gamepad', False))
+        self._settings_status_var = tk.StringVar(
+            value='✓ Settings saved – ready to play!' if self._settings_confirmed
+                  else '⚠ Please review and confirm your settings before starting.'
+        )
+        self._settings_tab = settings_tab
+        self._settings_built = False
+
+        # footer
+        footer = ttk.Frame(self)
+        footer.pack(side='bottom', fill='x')
+        self._footer_label = ttk.Label(footer, text='Ready', anchor='w')
+        self._footer_label.pack(side='left', padx=8, pady=6)
+
+        # show initial tab – go to Settings on first run
+        if not self._settings_confirmed:
+            self._tab_active = 'Settings'
+        self._apply_tab_styles()
+        self._show_tab(self._tab_active)
 
-        # Settings content
-        ttk.Label(settings_tab, text='Network Settings', font=(None, 12, 'bold')).pack(anchor='nw', padx=8, pady=(8,4))
+    def _build_settings_tab(self, settings_tab) -> None:
+        """Create the Settings tab widgets; called on the first switch to that tab."""
+        ttk.Label(settings_tab, text='Network Settings', style='Section.TLabel').pack(anchor='nw', padx=8, pady=(8,4))
         
         # Update rate setting
         rate_frame = ttk.Frame(settings_tab)
         rate_frame.pack(fill='x', padx=8, pady=12)
-        ttk.Label(rate_frame, text='Client Update Rate:', font=(None, 10, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(rate_frame, text='Client Update Rate:', style='Field.TLabel').pack(anchor='w', pady=(0,4))
         ttk.Label(rate_frame, text='Higher rates provide smoother gameplay but use more bandwidth.', 
-                 font=(None, 9), foreground='#888888').pack(anchor='w', pady=(0,8))
+                 style='Hint.TLabel').pack(anchor='w', pady=(0,8))
         
-        self.update_rate_var = tk.IntVar(value=self._config.get('update_rate', 60))
         rate_options_frame = ttk.Frame(rate_frame)
         rate_options_frame.pack(anchor='w', pady=4)
         
@@ -401,18 +568,12 @@ class App(tk.Tk):
         
         controller_frame = ttk.Frame(settings_tab)
         controller_frame.pack(fill='x', padx=8, pady=12)
-        ttk.Label(controller_frame, text='Controller Profile:', font=(None, 10, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(controller_frame, text='Controller Profile:', style='Field.TLabel').pack(anchor='w', pady=(0,4))
         ttk.Label(controller_frame, text='Select your controller type for proper button and axis mapping.', 
-                 font=(None, 9), foreground='#888888').pack(anchor='w', pady=(0,8))
+                 style='Hint.TLabel').pack(anchor='w', pady=(0,8))
         
-        # Import controller profiles to get available options
-        try:
-            from gp.core.controller_profiles import get_profile_names
-            profile_names = get_profile_names()
-        except Exception:
-            profile_names = ['Generic', 'PS4 Controller', 'PS5 Controller', 'Xbox 360 Controller']
+        profile_names = get_profile_names()
         
-        self.controller_profile_var = tk.StringVar(value=self._config.get('controller_profile_display', 'Generic'))
         controller_dropdown_frame = ttk.Frame(controller_frame)
         controller_dropdown_frame.pack(anchor='w', pady=4)
         
@@ -426,18 +587,17 @@ class App(tk.Tk):
         controller_dropdown.bind('<<ComboboxSelected>>', self._on_controller_change)
         
         ttk.Label(controller_frame, text='Note: Change takes effect when client restarts.', 
-                 font=(None, 8), foreground='#888888').pack(anchor='w', pady=(8,0))
+                 font=FONT_8, foreground='#888888').pack(anchor='w', pady=(8,0))
 
         # --- Multi-Gamepad Co-op setting ---
         ttk.Separator(settings_tab, orient='horizontal').pack(fill='x', padx=8, pady=12)
 
         multi_gp_frame = ttk.Frame(settings_tab)
         multi_gp_frame.pack(fill='x', padx=8, pady=12)
-        ttk.Label(multi_gp_frame, text='Multi-Gamepad Co-op:', font=(None, 10, 'bold')).pack(anchor='w', pady=(0,4))
+        ttk.Label(multi_gp_frame, text='Multi-Gamepad Co-op:', style='Field.TLabel').pack(anchor='w', pady=(0,4))
         ttk.Label(multi_gp_frame, text='Allow up to 4 remote players to connect as separate virtual controllers for local co-op games.',
-                 font=(None, 9), foreground='#888888', wraplength=500).pack(anchor='w', pady=(0,8))
+                 style='Hint.TLabel', wraplength=500).pack(anchor='w', pady=(0,8))
 
-        self._multi_gp_var = tk.BooleanVar(value=self._config.get('multi_gamepad', False))
         self._multi_gp_check = ttk.Checkbutton(
             multi_gp_frame, text='Enable Multi-Gamepad Co-op Mode',
             variable=self._multi_gp_var,
@@ -448,30 +608,22 @@ class App(tk.Tk):
         self._multi_gp_status = tk.Label(
             multi_gp_frame,
             text='Enabled' if self._multi_gp_var.get() else 'Disabled',
-            font=(None, 9, 'bold'),
+            font=FONT_9_B,
             fg='#22c55e' if self._multi_gp_var.get() else '#888888',
             bg=self._palette['frame']
         )
         self._multi_gp_status.pack(anchor='w', pady=(2,0))
 
-        # Apply saved multi-gamepad state to backend
-        if self._multi_gp_var.get():
-            self._gp.set_multi_gamepad(True)
-
         # --- Confirm & Save button ---
         ttk.Separator(settings_tab, orient='horizontal').pack(fill='x', padx=8, pady=12)
 
         confirm_frame = ttk.Frame(settings_tab)
         confirm_frame.pack(fill='x', padx=8, pady=(0, 8))
 
-        self._settings_status_var = tk.StringVar(
-            value='✓ Settings saved – ready to play!' if self._settings_confirmed
-                  else '⚠ Please review and confirm your settings before starting.'
-        )
         self._settings_status_label = tk.Label(
             confirm_frame,
             textvariable=self._settings_status_var,
-            font=(None, 10, 'bold'),
+            font=FONT_10_B,
             fg='#22c55e' if self._settings_confirmed else '#f59e0b',
             bg=self._palette['frame'],
             anchor='w'
@@ -481,14 +633,15 @@ class App(tk.Tk):
         self._confirm_btn = tk.Button(
             confirm_frame,
             text='  ✓  Confirm Settings & Save  ',
-            font=(None, 11, 'bold'),
+            font=FONT_11_B,
             bg='#22883a',
             fg='#ffffff',
             activebackground='#1a6b2e',
             activeforeground='#ffffff',
             relief='flat',
             cursor='hand2',
-            command=self._confirm_settings
+            command=self._confirm_settings,
+            state='normal' if self._gp is not None else 'disabled'
         )
         self._confirm_btn.pack(anchor='w', pady=(0, 4))
 
@@ -498,185 +651,347 @@ class App(tk.Tk):
         info_frame = ttk.Frame(settings_tab)
         info_frame.pack(fill='both', expand=True, padx=8, pady=8)
         
-        ttk.Label(info_frame, text='About CooPad', font=(None, 12, 'bold')).pack(anchor='w', pady=(0,8))
+        ttk.Label(info_frame, text='About CooPad', style='Section.TLabel').pack(anchor='w', pady=(0,8))
         
-        info_text = tk.Text(info_frame, wrap='word', height=12, font=(None, 9))
+        info_text = tk.Text(info_frame, wrap='word', height=12, font=FONT_9)
         info_text.pack(fill='both', expand=True)
-        info_text.insert('1.0', '''CooPad - Remote Gamepad over Network
-
-Version: 1.0.2
-License: Open Source
-
-CooPad allows you to use a gamepad over a network connection. The client captures gamepad inputs and sends them to the host, which creates a virtual gamepad that games can use.
-
-Features:
-• Windows support for Host and Client modes
-• Low latency gameplay
-• Configurable update rates
-• Controller profile selection (PS4, PS5, Xbox 360, Nintendo Switch)
-• Real-time network statistics
-• Automatic platform detection
-
-Network Requirements:
-• Both devices on same LAN, or
-• Connected via VPN (ZeroTier, Tailscale, etc.)
-• UDP port 7777 must be accessible
-
-For setup help, click the "Platform Help" button.
-''')
+        info_text.insert('1.0', ABOUT_TEXT)
         info_text.config(state='disabled', bg=self._palette['text_bg'], 
                         fg=self._palette['text_fg'], insertbackground=self._palette['text_fg'])
 
-        # footer
-        footer = ttk.Frame(self)
-        footer.pack(side='bottom', fill='x')
-        self._footer_label = ttk.Label(footer, text='Ready', anchor='w')
-        self._footer_label.pack(side='left', padx=8, pady=6)
+        self._settings_built = True
 
-        # show initial tab – go to Settings on first run
-        if not self._settings_confirmed:
-            self._tab_active = 'Settings'
-        self._apply_tab_styles()
-        self._show_tab(self._tab_active)
+    def _load_logo(self):
+        """Return the sidebar logo as a PhotoImage, or None if it can't be loaded.
 
-    def _apply_tab_styles(self):
-        # make header contrast and set initial button styles
-        try:
-            # Use instance palette
-            pal = self._palette
-            self.configure(bg=pal['bg'])
+        The pre-resized asset (or a copy cached on a previous run) is decoded
+        natively by Tk; PIL is only needed to generate it from the full-size PNG.
+        """
+        # A missing file fails the same way as an unreadable one, so no exists() probes
+        for path in (LOGO_PATH, LOGO_CACHE_PATH):
             try:
-                self.style.configure('TFrame', background=pal['frame'])
-                self.style.configure('TLabel', background=pal['frame'], foreground=pal['text_fg'])
-                self.style.configure('TButton', background=pal['button_bg'], foreground=pal['text_fg'])
-                self.style.configure('TEntry', fieldbackground=pal['entry_bg'], foreground=pal['text_fg'])
-            except Exception:
+                return tk.PhotoImage(master=self, file=path)
+            except tk.TclError:
                 pass
-
-            self._top_bar.config(bg='#000000')
-            for n, b in self._tab_buttons.items():
-                try:
-                    b.config(bg=self._top_bar.cget('bg'), fg='#9a9a9a')
-                except Exception:
-                    pass
-            if self._tab_active in self._tab_buttons:
-                self._tab_buttons[self._tab_active].config(bg='#111111', fg='#ffffff')
-            self._header_label.config(background=self._top_bar.cget('bg'), foreground='#ffffff')
-            # text widgets
+        try:
+            from PIL import Image, ImageTk
+            img = Image.open(PNG_PATH).convert('RGBA')
+            # The source is square, so thumbnail() matches a centre-cropping fit
+            img.thumbnail(LOGO_SIZE, Image.LANCZOS)
             try:
-                self.host_box.config(bg=pal['text_bg'], fg=pal['text_fg'], insertbackground=pal['text_fg'])
-                self.client_box.config(bg=pal['text_bg'], fg=pal['text_fg'], insertbackground=pal['text_fg'])
-                self._monitor_log.config(bg=pal['text_bg'], fg=pal['text_fg'], insertbackground=pal['text_fg'])
-            except Exception:
+                os.makedirs(CONFIG_DIR, exist_ok=True)
+                img.save(LOGO_CACHE_PATH)
+            except OSError:
                 pass
+            return ImageTk.PhotoImage(img)
         except Exception:
+            return None
+
+    @staticmethod
+    def _probe_platform_status() -> dict:
+        """Build the platform name and status dicts from the shared PlatformInfo."""
+        platform_info = get_platform_info()
+        return {
+            'name': platform_info.get_platform_name(),
+            'host': platform_info.get_host_status(),
+            'client': platform_info.get_client_status(),
+            'compat': platform_info.get_compatibility_info(),
+        }
+
+    def _platform_status(self) -> dict:
+        """Cached platform name and status dicts; probed inline if the startup probe hasn't landed yet.
+
+        Once the cache is older than PLATFORM_STATUS_TTL it is still returned, and
+        a background re-check updates it (and the sidebar) shortly after.
+        """
+        if self._plat_cache is None:
+            self._plat_probe_time = time.monotonic()
+            self._apply_platform_status(self._probe_platform_status())
+        elif time.monotonic() - self._plat_probe_time > PLATFORM_STATUS_TTL:
+            self._refresh_platform_status()
+        return self._plat_cache
+
+    def _refresh_platform_status(self, recheck: bool = True) -> None:
+        """Probe platform status on a worker thread; _apply_platform_status takes the result.
+
+        With recheck, capabilities are detected again rather than reused.
+        """
+        # Counted from the start, so callers within the TTL don't start another probe
+        self._plat_probe_time = time.monotonic()
+        def probe():
+            if recheck:
+                get_platform_info().refresh()
+            self._post(self._apply_platform_status, self._probe_platform_status())
+        threading.Thread(target=probe, daemon=True).start()
+
+    @staticmethod
+    def _compat_notice_text(compat_info: dict) -> tuple:
+        """Return the (text, color) of the compatibility notice under the top bar."""
+        if compat_info['can_host'] and compat_info['can_client']:
+            notice_text = (
+                f"✓ {compat_info['platform']} system ready for Host and Client modes. "
+                "Ensure both devices are on the same network or use VPN (ZeroTier, Tailscale)."
+            )
+            notice_fg = '#22c55e'
+        elif compat_info['can_host']:
+            notice_text = (
+                f"⚠ {compat_info['platform']} system ready for Host mode. "
+                "Client mode needs pygame installed. Click 'Platform Help' for setup instructions."
+            )
+            notice_fg = '#f59e0b'
+        elif compat_info['can_client']:
+            notice_text = (
+                f"⚠ {compat_info['platform']} system ready for Client mode. "
+                "Host mode needs virtual gamepad driver. Click 'Platform Help' for setup instructions."
+            )
+            notice_fg = '#f59e0b'
+        else:
+            notice_text = (
+                f"✗ {compat_info['platform']} system not ready. "
+                "Missing required drivers. Click 'Platform Help' for setup instructions."
+            )
+            notice_fg = '#ef4444'
+        return notice_text, notice_fg
+
+    def _apply_platform_status(self, plat: dict) -> None:
+        """Store a fresh probe and update the platform widgets that changed."""
+        old, self._plat_cache = self._plat_cache, plat
+        if plat == old:
+            return
+        self._help_content = None
+        if old is None or plat['name'] != old['name']:
+            self._platform_name_label.config(text=f"Platform: {plat['name']}")
+        if old is None or plat['compat'] != old['compat']:
+            text, fg = self._compat_notice_text(plat['compat'])
+            self._compat_notice.config(text=text, fg=fg)
+        for key, icon, label in (('host', self.host_status_icon, self.host_status_label),
+                                 ('client', self.client_status_icon, self.client_status_label)):
+            status = plat[key]
+            if old is None or status != old[key]:
+                icon.config(text=status['icon'], fg=status['color'])
+                label.config(text=status['message'])
+
+    def _apply_tab_styles(self):
+        # make header contrast and set initial button styles
+        pal = self._palette
+        self.configure(bg=pal['bg'])
+        try:
+            self.style.configure('TFrame', background=pal['frame'])
+            self.style.configure('TLabel', background=pal['frame'], foreground=pal['text_fg'])
+            self.style.configure('TButton', background=pal['button_bg'], foreground=pal['text_fg'])
+            self.style.configure('TEntry', fieldbackground=pal['entry_bg'], foreground=pal['text_fg'])
+        except tk.TclError:
             pass
 
+        # Tab buttons: flat on the black top bar, highlighted while selected or hovered
+        tab_bg = pal['top_bar']
+        self.style.configure('Tab.TButton', font=FONT_UI_10_B, padding=(18, 10), relief='flat',
+                             borderwidth=0, background=tab_bg, foreground='#9a9a9a',
+                             bordercolor=tab_bg, lightcolor=tab_bg, darkcolor=tab_bg)
+        tab_on = [('selected', '#111111'), ('active', '#111111')]
+        self.style.map('Tab.TButton', background=tab_on, lightcolor=tab_on, darkcolor=tab_on,
+                       foreground=[('selected', '#ffffff'), ('active', '#ffffff')])
+        self._header_label.config(background=tab_bg, foreground='#ffffff')
+        # text widgets
+        for box in (self.host_box, self.client_box, self._monitor_log):
+            box.config(bg=pal['text_bg'], fg=pal['text_fg'], insertbackground=pal['text_fg'])
+
     def _show_tab(self, name: str):
+        if name == 'Settings' and not self._settings_built:
+            self._build_settings_tab(self._settings_tab)
+        # Re-check the sidebar's platform status in the background once it is stale
+        # (before the startup probe lands there is nothing to re-check yet)
+        if self._plat_cache is not None:
+            self._platform_status()
         # switch visible content
-        try:
-            for n, f in self._content_frames.items():
-                if n == name:
-                    f.pack(fill='both', expand=True)
-                else:
-                    f.pack_forget()
-            # show relevant left controls
+        for n, f in self._content_frames.items():
+            if n == name:
+                f.pack(fill='both', expand=True)
+            else:
+                f.pack_forget()
+        # show relevant left controls
+        if name == 'Client':
+            self.client_controls.pack(fill='x', padx=12)
+            self.host_controls.pack_forget()
+        else:
+            # Host, plus Monitor & Settings — show host controls for convenience
+            self.host_controls.pack(fill='x', padx=12)
+            self.client_controls.pack_forget()
+        # update buttons
+        for n, b in self._tab_buttons.items():
+            b.state(('selected',) if n == name else ('!selected',))
+        self._tab_active = name
+        # Stats received while the Monitor was hidden were only stored
+        if name == 'Monitor':
+            self._flush_monitor()
+
+    # ---------- Backend -> UI bridge ----------
+
+    def _init_wakeup(self) -> bool:
+        """Let _post wake the Tk event loop through a socketpair; False where Tk can't watch files."""
+        if sys.platform == 'win32' or not hasattr(self.tk, 'createfilehandler'):
+            return False
+        import socket
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.tk.createfilehandler(self._wake_r, tk.READABLE, self._on_wake)
+        return True
+
+    def destroy(self) -> None:
+        """Remove the wake-up file handler and close its socketpair with the window."""
+        wake_r, wake_w = self._wake_r, self._wake_w
+        # Backend threads that post after this see no wake socket and just queue
+        self._wake_r = self._wake_w = None
+        if wake_r is not None:
+            self.tk.deletefilehandler(wake_r)
+            wake_r.close()
+            wake_w.close()
+        super().destroy()
+
+    def _post(self, handler, payload) -> None:
+        """Queue handler(payload) for the Tk thread; safe to call from any thread."""
+        input_queue.append((handler, payload))
+        if self._wake_w is not None and not self._wake_pending:
+            self._wake_pending = True
             try:
-                if name == 'Host':
-                    self.host_controls.pack(fill='x', padx=12)
-                    self.client_controls.pack_forget()
-                elif name == 'Client':
-                    self.client_controls.pack(fill='x', padx=12)
-                    self.host_controls.pack_forget()
-                else:
-                    # Monitor & Settings — show host controls for convenience
-                    self.host_controls.pack(fill='x', padx=12)
-                    self.client_controls.pack_forget()
-            except Exception:
+                self._wake_w.send(b'\0')
+            except OSError:
+                # socket buffer full (a wake is already queued) or closed at exit
                 pass
-            # update buttons
-            for n, b in self._tab_buttons.items():
-                try:
-                    if n == name:
-                        b.config(bg='#111111', fg='#ffffff')
-                    else:
-                        b.config(bg=self._top_bar.cget('bg'), fg='#7f7f7f')
-                except Exception:
-                    pass
-            self._tab_active = name
-        except Exception:
-            pass
 
-    def _append_status(self, text: str) -> None:
+    def _on_wake(self, fd, mask) -> None:
         try:
-            if text.startswith('HOST|'):
-                t = text.split('|', 1)[1]
-                self._append_text(self.host_box, t)
-            elif text.startswith('CLIENT|'):
-                t = text.split('|', 1)[1]
-                self._append_text(self.client_box, t)
-            else:
-                self._append_text(self.host_box, text)
-        except Exception:
+            self._wake_r.recv(4096)
+        except BlockingIOError:
             pass
+        # Cleared before draining, so a post racing with the drain sends a new wake
+        self._wake_pending = False
+        self._drain_input_queue()
+
+    def _post_status(self, text: str) -> None:
+        """Status callback for backend threads: queue the line for the Tk thread."""
+        self._post(self._append_status, text)
+
+    def _post_telemetry(self, msg) -> None:
+        """Telemetry callback for backend threads: queue the message for the Tk thread.
+
+        Binary frames are decoded here, on the backend thread, so the Tk thread
+        only receives ready-made field tuples.
+        """
+        if type(msg) is bytes:
+            entry = self._frame_handlers.get(msg[0]) if msg else None
+            if entry is None:
+                return
+            parse, handler = entry
+            try:
+                fields = parse(msg)
+            except struct.error:
+                # truncated frame
+                return
+            self._post(handler, fields)
+        else:
+            self._post(self._set_telemetry, msg)
 
-    def _append_text(self, widget: tk.Text, text: str) -> None:
-        try:
-            widget.config(state='normal')
-            widget.insert('end', text + '\n')
-            widget.see('end')
-            widget.config(state='disabled')
-        except Exception:
-            pass
+    def _drain_input_queue(self) -> bool:
+        """Run every queued backend event; True if there were any.
 
-    def _set_telemetry(self, text: str) -> None:
+        A failing handler is reported like any Tk callback error and the rest
+        of the queue still runs.
+        """
+        drained = False
+        while input_queue:
+            try:
+                handler, payload = input_queue.popleft()
+            except IndexError:
+                break
+            try:
+                handler(payload)
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
+            drained = True
+        return drained
+
+    def _poll_ui(self) -> None:
+        """Drain queued backend events; poll quickly while busy and back off when idle."""
         try:
-            if text.startswith('HOST|'):
-                t = text.split('|', 1)[1].strip()
-                # Check for multi-gamepad telemetry messages
-                # Format: HOST|PLAYER_STATS|client_id|name|color|slot|latency|jitter|rate|seq
-                # Format: HOST|PLAYER_JOIN|client_id|name|color|slot
-                # Format: HOST|PLAYER_LEAVE|client_id|name|color|slot
-                if t.startswith('PLAYER_STATS|'):
-                    self._handle_player_stats(t)
-                    return
-                elif t.startswith('PLAYER_JOIN|'):
-                    self._handle_player_join(t)
-                    return
-                elif t.startswith('PLAYER_LEAVE|'):
-                    self._handle_player_leave(t)
-                    return
-                # Legacy single-mode telemetry
-                parts = [p.strip() for p in t.split('|')]
-                for part in parts:
-                    if part.startswith('Latency:'):
-                        self.host_latency_var.set(part)
-                    elif part.startswith('Jitter:'):
-                        self.host_jitter_var.set(part)
-                    elif part.startswith('Rate:'):
-                        rate_part = part.split('seq=')[0].strip()
-                        self.host_packets_var.set(rate_part)
-                        if 'seq=' in part:
-                            seq = part.split('seq=')[1].strip()
-                            self.host_packets_var.set(f'{rate_part} | Seq: {seq}')
-            elif text.startswith('CLIENT|'):
-                t = text.split('|', 1)[1].strip()
-                parts = [p.strip() for p in t.split('|')]
-                for part in parts:
-                    if part.startswith('Latency:'):
-                        self.client_latency_var.set(part)
-                    elif part.startswith('Jitter:'):
-                        self.client_jitter_var.set(part)
-                    elif part.startswith('Rate:'):
-                        rate_part = part.split('seq=')[0].strip()
-                        self.client_packets_var.set(rate_part)
-                        if 'seq=' in part:
-                            seq = part.split('seq=')[1].strip()
-                            self.client_packets_var.set(f'{rate_part} | Seq: {seq}')
+            if self._drain_input_queue():
+                self._poll_interval = UI_POLL_BUSY_MS
             else:
-                self._footer_label.config(text=text)
-        except Exception:
-            pass
+                self._poll_interval = min(UI_POLL_IDLE_MS, self._poll_interval * 2)
+        finally:
+            # Never let an error stop the poller for good
+            self.after(self._poll_interval, self._poll_ui)
+
+    def _append_status(self, text: str) -> None:
+        head, sep, rest = text.partition('|')
+        box = self._status_boxes.get(head) if sep else None
+        if box is None:
+            self._append_text(self.host_box, text)
+        else:
+            self._append_text(box, rest)
+
+    def _append_text(self, widget: tk.Text, text: str, tag=()) -> None:
+        pending = self._pending_logs.get(widget)
+        if pending is None:
+            pending = self._pending_logs[widget] = []
+        # Flat (chars, tags, chars, tags, ...) list, the argument form Text.insert takes
+        pending += (text + '\n', tag)
+        if not self._logs_scheduled:
+            self._logs_scheduled = True
+            self.after(LOG_FLUSH_MS, self._flush_logs)
+
+    def _flush_logs(self) -> None:
+        """Write all pending log lines with one insert per widget, tags included."""
+        self._logs_scheduled = False
+        pending, self._pending_logs = self._pending_logs, {}
+        for widget, chunks in pending.items():
+            try:
+                widget.config(state='normal')
+                widget.insert('end', *chunks)
+                self._trim_text(widget, sum(c.count('\n') for c in chunks[::2]))
+                widget.see('end')
+                widget.config(state='disabled')
+            except tk.TclError:
+                # widget destroyed during shutdown
+                pass
+
+    def _trim_text(self, widget: tk.Text, added: int) -> None:
+        """Count lines just added and delete the oldest beyond MAX_LOG_LINES."""
+        lines = self._log_lines.get(widget, 0) + added
+        if lines > MAX_LOG_LINES:
+            widget.delete('1.0', f'{lines - MAX_LOG_LINES + 1}.0')
+            lines = MAX_LOG_LINES
+        self._log_lines[widget] = lines
+
+    def _set_telemetry(self, text: str) -> None:
+        # Text telemetry only feeds the footer; link stats arrive as binary frames
+        self._footer_label.config(text=text)
+
+    def _handle_link_stats(self, fields: tuple) -> None:
+        """Stage a decoded LINK_STATS frame for the next idle flush."""
+        role, latency, jitter, rate, seq = fields
+        labels = self._telem_labels[role]
+        pending = self._pending_telem
+        pending[labels[0]] = f'Latency: {latency:.1f}ms'
+        # Jitter is NaN where it isn't measured (demo mode, a single sample)
+        if not math.isnan(jitter):
+            pending[labels[1]] = f'Jitter: {jitter:.1f}ms'
+        # The host reports rate 0 until a full second of packets has been counted
+        if rate > 0:
+            # Configured client rates are whole numbers; measured host rates are not
+            rate_text = f'{rate:.0f}' if rate.is_integer() else f'{rate:.1f}'
+            pending[labels[2]] = f'Rate: {rate_text}Hz | Seq: {seq}'
+        if not self._telem_scheduled:
+            self._telem_scheduled = True
+            self.after_idle(self._flush_telem)
+
+    def _flush_telem(self) -> None:
+        """Apply only the newest staged telemetry values; intermediate ones are dropped."""
+        self._telem_scheduled = False
+        pending, self._pending_telem = self._pending_telem, {}
+        for label, value in pending.items():
+            label.configure(text=value)
 
     def _toggle_host(self):
         if getattr(self, '_host_running', False) is not True:
@@ -686,7 +1001,7 @@ For setup help, click the "Platform Help" button.
                 return
 
             # Check if host is ready
-            host_status = platform_info.get_host_status()
+            host_status = self._platform_status()['host']
             if host_status['status'] == 'error':
                 self._append_status(f"HOST|✗ Cannot start: {host_status['message']}")
                 self._append_status(f"HOST|→ Solution: {host_status.get('action', host_status.get('details', ''))}")
@@ -698,7 +1013,7 @@ For setup help, click the "Platform Help" button.
             self._append_status('HOST|Starting host...')
             try:
                 port = int(self.port_entry.get())
-            except Exception:
+            except ValueError:
                 port = 7777
                 self._append_status(f'HOST|Invalid port, using default: {port}')
             
@@ -714,10 +1029,14 @@ For setup help, click the "Platform Help" button.
             self.host_state_label.config(text='Host: running', foreground='#228B22')
         else:
             self._append_status('HOST|Stopping host...')
-            self._gp.stop_host()
-            self._host_running = False
-            self.host_btn.config(text='Start Host')
-            self.host_state_label.config(text='Host: stopped', foreground='#b22222')
+            # Stopping joins backend threads; keep the button disabled until it completes
+            self.host_btn.config(state='disabled')
+            self._stop_in_background(self._gp.stop_host, self._host_stopped)
+
+    def _host_stopped(self, _=None) -> None:
+        self._host_running = False
+        self.host_btn.config(text='Start Host', state='normal')
+        self.host_state_label.config(text='Host: stopped', foreground='#b22222')
 
     def _toggle_client(self):
         if getattr(self, '_client_running', False) is not True:
@@ -727,7 +1046,7 @@ For setup help, click the "Platform Help" button.
                 return
 
             # Check if client is ready
-            client_status = platform_info.get_client_status()
+            client_status = self._platform_status()['client']
             if client_status['status'] == 'warning':
                 self._append_status(f"CLIENT|⚠ Note: {client_status['message']}")
                 self._append_status(f"CLIENT|  Will send test data (no physical gamepad)")
@@ -740,7 +1059,7 @@ For setup help, click the "Platform Help" button.
             
             try:
                 port = int(self.port_entry.get())
-            except Exception:
+            except ValueError:
                 port = 7777
                 self._append_status(f'CLIENT|Invalid port, using default: {port}')
             
@@ -752,76 +1071,56 @@ For setup help, click the "Platform Help" button.
             self.client_state_label.config(text='Client: running', foreground='#228B22')
         else:
             self._append_status('CLIENT|Stopping client...')
-            self._gp.stop_client()
-            self._client_running = False
-            self.client_btn.config(text='Start Client')
-            self.client_state_label.config(text='Client: stopped', foreground='#b22222')
+            self.client_btn.config(state='disabled')
+            self._stop_in_background(self._gp.stop_client, self._client_stopped)
+
+    def _client_stopped(self, _=None) -> None:
+        self._client_running = False
+        self.client_btn.config(text='Start Client', state='normal')
+        self.client_state_label.config(text='Client: stopped', foreground='#b22222')
+
+    def _stop_in_background(self, stop, done) -> None:
+        """Run a blocking backend stop on a worker thread, then queue done for the Tk thread."""
+        def run():
+            stop()
+            self._post(done, None)
+        threading.Thread(target=run, daemon=True).start()
 
     def _clear_log(self):
-        try:
-            self.host_box.config(state='normal')
-            self.host_box.delete('1.0', 'end')
-            self.host_box.config(state='disabled')
-            self.client_box.config(state='normal')
-            self.client_box.delete('1.0', 'end')
-            self.client_box.config(state='disabled')
-        except Exception:
-            pass
+        for box in (self.host_box, self.client_box):
+            # Lines still waiting for the next flush predate the clear as well
+            self._pending_logs.pop(box, None)
+            if not self._log_lines.get(box):
+                continue
+            box.config(state='normal')
+            box.delete('1.0', 'end')
+            box.config(state='disabled')
+            self._log_lines[box] = 0
     
-    def _show_platform_help(self):
-        """Show platform-specific help dialog."""
-        help_window = tk.Toplevel(self)
-        help_window.title("Platform Setup Help")
-        help_window.geometry("700x600")
-        help_window.transient(self)
-        
-        # Create scrollable text widget
-        text_frame = ttk.Frame(help_window)
-        text_frame.pack(fill='both', expand=True, padx=20, pady=20)
-        
-        scrollbar = ttk.Scrollbar(text_frame)
-        scrollbar.pack(side='right', fill='y')
-        
-        help_text = tk.Text(text_frame, wrap='word', font=(None, 10),
-                           yscrollcommand=scrollbar.set, bg='#1a1d1f', fg='#e5e7eb')
-        help_text.pack(side='left', fill='both', expand=True)
-        scrollbar.config(command=help_text.yview)
-        
-        # Build help content
+    def _build_help_parts(self):
+        """Return the static (head, middle, tail) text around the help dialog's status blocks."""
+        platform_info = get_platform_info()
         platform_name = platform_info.get_platform_name()
-        host_status = platform_info.get_host_status()
-        client_status = platform_info.get_client_status()
         setup_instructions = platform_info.get_setup_instructions()
-        
-        help_content = f"""═══════════════════════════════════════════════════════
+        head = f"""═══════════════════════════════════════════════════════
 CooPad Platform Setup Help - {platform_name}
 ═══════════════════════════════════════════════════════
 
 CURRENT STATUS:
 ───────────────────────────────────────────────────────
 
-Host Mode: {host_status['icon']} {host_status['status'].upper()}
-{host_status['message']}
-{host_status.get('details', '')}
-
-Client Mode: {client_status['icon']} {client_status['status'].upper()}
-{client_status['message']}
-{client_status.get('details', '')}
-
-═══════════════════════════════════════════════════════
-SETUP INSTRUCTIONS
-═══════════════════════════════════════════════════════
-
-HOST MODE SETUP:
 """
-        for instruction in setup_instructions['host']:
-            help_content += f"  {instruction}\n"
-        
-        help_content += "\nCLIENT MODE SETUP:\n"
-        for instruction in setup_instructions['client']:
-            help_content += f"  {instruction}\n"
-        
-        help_content += """
+        middle = [
+            "\n═══════════════════════════════════════════════════════\n"
+            "SETUP INSTRUCTIONS\n"
+            "═══════════════════════════════════════════════════════\n"
+            "\n"
+            "HOST MODE SETUP:\n"
+        ]
+        middle.extend(f"  {instruction}\n" for instruction in setup_instructions['host'])
+        middle.append("\nCLIENT MODE SETUP:\n")
+        middle.extend(f"  {instruction}\n" for instruction in setup_instructions['client'])
+        middle.append("""
 ═══════════════════════════════════════════════════════
 CROSS-PLATFORM COMPATIBILITY
 ═══════════════════════════════════════════════════════
@@ -842,15 +1141,8 @@ CROSS-PLATFORM COMPATIBILITY
   4. Games see the virtual gamepad as real hardware
 
 ⚠️ COMMON ISSUES:
-"""
-        
-        # Add platform-specific issues
-        if host_status.get('action'):
-            help_content += f"\n  HOST: {host_status['action']}\n"
-        if client_status.get('action'):
-            help_content += f"\n  CLIENT: {client_status['action']}\n"
-        
-        help_content += """
+""")
+        tail = """
 ═══════════════════════════════════════════════════════
 TROUBLESHOOTING
 ═══════════════════════════════════════════════════════
@@ -875,13 +1167,60 @@ No gamepad detected:
 For more information, see README.md
 ═══════════════════════════════════════════════════════
 """
+        return head, ''.join(middle), tail
+
+    def _show_platform_help(self):
+        """Show platform-specific help dialog."""
+        help_window = tk.Toplevel(self)
+        help_window.title("Platform Setup Help")
+        help_window.geometry("700x600")
+        help_window.transient(self)
         
-        help_text.insert('1.0', help_content)
+        # Create scrollable text widget
+        text_frame = ttk.Frame(help_window)
+        text_frame.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        scrollbar = ttk.Scrollbar(text_frame)
+        scrollbar.pack(side='right', fill='y')
+        
+        help_text = tk.Text(text_frame, wrap='word', font=FONT_10,
+                           yscrollcommand=scrollbar.set, bg='#1a1d1f', fg='#e5e7eb')
+        help_text.pack(side='left', fill='both', expand=True)
+        scrollbar.config(command=help_text.yview)
+        
+        # A stale status is re-checked in the background and shows up next time
+        plat = self._platform_status()
+        if self._help_content is None:
+            self._help_content = self._render_help_content(plat)
+
+        help_text.insert('1.0', self._help_content)
         help_text.config(state='disabled')
         
         # Close button
         ttk.Button(help_window, text='Close', 
                   command=help_window.destroy).pack(pady=(0,20))
+
+    def _render_help_content(self, plat: dict) -> str:
+        """Return the full Platform Help text for the given platform status."""
+        head, middle, tail = self._build_help_parts()
+        host_status = plat['host']
+        client_status = plat['client']
+        status_block = (
+            f"Host Mode: {host_status['icon']} {host_status['status'].upper()}\n"
+            f"{host_status['message']}\n"
+            f"{host_status.get('details', '')}\n"
+            f"\n"
+            f"Client Mode: {client_status['icon']} {client_status['status'].upper()}\n"
+            f"{client_status['message']}\n"
+            f"{client_status.get('details', '')}\n"
+        )
+        # Add platform-specific issues
+        issues = []
+        if host_status.get('action'):
+            issues.append(f"\n  HOST: {host_status['action']}\n")
+        if client_status.get('action'):
+            issues.append(f"\n  CLIENT: {client_status['action']}\n")
+        return ''.join((head, status_block, middle, *issues, tail))
     
     # ---------- Settings helpers ----------
 
@@ -894,11 +1233,7 @@ For more information, see README.md
         # Apply to backend
         self._gp.set_update_rate(rate)
         self._gp.set_multi_gamepad(multi_gp)
-        try:
-            from gp.core.controller_profiles import get_profile_by_display_name
-            profile_key = get_profile_by_display_name(display_name)
-        except Exception:
-            profile_key = 'generic'
+        profile_key = _profile_key_for(display_name)
         self._gp.set_controller_profile(profile_key)
 
         # Persist
@@ -940,20 +1275,16 @@ For more information, see README.md
     def _on_rate_change(self):
         """Handle update rate change."""
         rate = self.update_rate_var.get()
-        self._gp.set_update_rate(rate)
+        if self._gp is not None:
+            self._gp.set_update_rate(rate)
         self._append_status(f'CLIENT|Update rate changed to {rate} Hz')
     
     def _on_controller_change(self, event=None):
         """Handle controller profile change."""
         display_name = self.controller_profile_var.get()
-        # Convert display name to profile key
-        try:
-            from gp.core.controller_profiles import get_profile_by_display_name
-            profile_key = get_profile_by_display_name(display_name)
-            self._gp.set_controller_profile(profile_key)
-            self._append_status(f'CLIENT|Controller profile changed to {display_name}')
-        except Exception as e:
-            self._append_status(f'CLIENT|Error changing controller profile: {e}')
+        if self._gp is not None:
+            self._gp.set_controller_profile(_profile_key_for(display_name))
+        self._append_status(f'CLIENT|Controller profile changed to {display_name}')
 
     # =====================  Multi-Gamepad Co-op  =====================
 
@@ -981,176 +1312,188 @@ For more information, see README.md
                 self._multi_gp_var.set(False)
                 return
             self._multi_gp_status.config(text='Enabled', fg='#22c55e')
-            self._gp.set_multi_gamepad(True)
+            if self._gp is not None:
+                self._gp.set_multi_gamepad(True)
             self._monitor_status_label.config(text='Multi-Gamepad: ON', fg='#22c55e')
             self._append_status('HOST|Multi-Gamepad Co-op mode enabled')
         else:
             self._multi_gp_status.config(text='Disabled', fg='#888888')
-            self._gp.set_multi_gamepad(False)
+            if self._gp is not None:
+                self._gp.set_multi_gamepad(False)
             self._monitor_status_label.config(text='Multi-Gamepad: OFF', fg='#888888')
             self._append_status('HOST|Multi-Gamepad Co-op mode disabled')
 
     # =====================  Player Card Management  =====================
 
-    def _handle_player_join(self, raw: str):
-        """Handle PLAYER_JOIN|client_id|name|color|slot telemetry."""
+    def _handle_player_join(self, fields: tuple):
+        """Handle a decoded PLAYER_JOIN frame: (client_id, slot, color_idx, name)."""
+        cid, slot, color_idx, name = fields
         try:
-            parts = raw.split('|')
-            # PLAYER_JOIN|client_id|name|color|slot
-            cid = int(parts[1])
-            name = parts[2]
-            color = parts[3]
-            slot = int(parts[4])
-            self._create_player_card(cid, name, color, slot)
-            self._log_monitor_event(f'\u25b6 Player {slot} "{name}" connected', color)
-        except Exception:
-            pass
-
-    def _handle_player_leave(self, raw: str):
-        """Handle PLAYER_LEAVE|client_id|name|color|slot telemetry."""
-        try:
-            parts = raw.split('|')
-            cid = int(parts[1])
-            name = parts[2]
-            color = parts[3]
-            slot = int(parts[4])
-            self._remove_player_card(cid)
-            self._log_monitor_event(f'\u25a0 Player {slot} "{name}" disconnected', '#888888')
-        except Exception:
-            pass
-
-    def _handle_player_stats(self, raw: str):
-        """Handle PLAYER_STATS|client_id|name|color|slot|latency|jitter|rate|seq."""
-        try:
-            parts = raw.split('|')
-            cid = int(parts[1])
-            name = parts[2]
-            color = parts[3]
-            slot = int(parts[4])
-            latency = parts[5]
-            jitter = parts[6]
-            rate = parts[7]
-            seq = parts[8]
-            self._update_player_card(cid, name, color, slot, latency, jitter, rate, seq)
-        except Exception:
-            pass
-
-    def _create_player_card(self, cid: int, name: str, color: str, slot: int):
-        """Create a player card widget in the Monitor tab."""
-        if cid in self._player_cards:
+            color = PLAYER_COLORS[color_idx]
+        except IndexError:
             return
-        # Hide the empty label
-        try:
-            self._monitor_empty_label.pack_forget()
-        except Exception:
-            pass
-
-        card = tk.Frame(self._monitor_cards_frame, bg='#1a1d1f', relief='flat',
-                        highlightbackground=color, highlightthickness=2, padx=16, pady=12)
-        card.pack(fill='x', padx=16, pady=8)
+        self._create_player_card(cid, name, color, slot)
+        self._log_monitor_event(f'\u25b6 Player {slot} "{name}" connected', PLAYER_LOG_TAGS[color_idx])
+
+    def _handle_player_leave(self, fields: tuple):
+        """Handle a decoded PLAYER_LEAVE frame: (client_id, slot, color_idx, name)."""
+        cid, slot, _, name = fields
+        if 1 <= slot <= MAX_PLAYERS and self._player_cids[slot - 1] == cid:
+            self._pending_stats[slot - 1] = None
+            self._remove_player_card(slot)
+        self._log_monitor_event(f'\u25a0 Player {slot} "{name}" disconnected', 'dim')
+
+    def _handle_player_stats(self, fields: tuple):
+        """Handle a decoded PLAYER_STATS frame: (client_id, slot, latency, jitter, rate, seq)."""
+        slot = fields[1]
+        if not 1 <= slot <= MAX_PLAYERS:
+            return
+        self._pending_stats[slot - 1] = fields
+        self._monitor_dirty = True
+        if self._tab_active == 'Monitor' and not self._monitor_scheduled:
+            self._monitor_scheduled = True
+            self.after(MONITOR_REFRESH_MS, self._flush_monitor)
+
+    def _flush_monitor(self):
+        """Paint the newest stats for every slot that changed since the last flush."""
+        self._monitor_scheduled = False
+        if not self._monitor_dirty:
+            return
+        self._monitor_dirty = False
+        pending = self._pending_stats
+        for i, stats in enumerate(pending):
+            if stats is not None:
+                pending[i] = None
+                # Stats for a player whose card isn't up (yet) are dropped
+                if self._player_cids[i] == stats[0]:
+                    self._update_player_card(*stats[1:])
+
+    # Card geometry on the monitor canvas (pixels)
+    _CARD_MARGIN = 16
+    _CARD_HEIGHT = 76
+    _CARD_SPACING = 16
+    # Latency text colors: green < 10 ms, amber < 30 ms, red otherwise
+    _LAT_COLORS = ('#22c55e', '#f59e0b', '#ef4444')
+
+    def _draw_player_card(self, slot: int):
+        """Draw the (hidden) card items for a slot; colors and name are set on join."""
+        i = slot - 1
+        c = self._monitor_canvas
+        tag = f'slot{slot}'
+        right_tag = f'slot{slot}_right'
+        x0 = self._CARD_MARGIN
+        x1 = self._monitor_width - self._CARD_MARGIN
+        y0 = self._CARD_SPACING // 2 + i * (self._CARD_HEIGHT + self._CARD_SPACING)
+        y1 = y0 + self._CARD_HEIGHT
+
+        self._player_rects[i] = c.create_rectangle(x0, y0, x1, y1, fill='#1a1d1f', width=2, tags=(tag,))
 
         # Row 1: colored circle + name + slot badge
-        top_row = tk.Frame(card, bg='#1a1d1f')
-        top_row.pack(fill='x')
-
-        # Colored dot
-        dot = tk.Canvas(top_row, width=16, height=16, bg='#1a1d1f', highlightthickness=0)
-        dot.create_oval(2, 2, 14, 14, fill=color, outline=color)
-        dot.pack(side='left', padx=(0, 8))
-
-        name_lbl = tk.Label(top_row, text=name, font=('Segoe UI', 13, 'bold'),
-                            fg=color, bg='#1a1d1f')
-        name_lbl.pack(side='left')
-
-        slot_badge = tk.Label(top_row, text=f'  PLAYER {slot}  ', font=('Segoe UI', 8, 'bold'),
-                              fg='#000000', bg=color, relief='flat')
-        slot_badge.pack(side='right', padx=(8, 0))
+        self._player_dot_items[i] = c.create_oval(x0 + 16, y0 + 14, x0 + 28, y0 + 26, tags=(tag,))
+        self._player_name_items[i] = c.create_text(x0 + 36, y0 + 20, anchor='w',
+                                                   font=FONT_UI_13_B, tags=(tag,))
+        badge_text = c.create_text(x1 - 16, y0 + 20, text=f'  PLAYER {slot}  ', anchor='e',
+                                   font=FONT_UI_8_B, fill='#000000', tags=(tag, right_tag))
+        self._player_badge_rects[i] = c.create_rectangle(*c.bbox(badge_text), tags=(tag, right_tag))
+        c.tag_raise(badge_text)
 
         # Row 2: stats
-        stats_row = tk.Frame(card, bg='#1a1d1f')
-        stats_row.pack(fill='x', pady=(8, 0))
-
-        lat_lbl = tk.Label(stats_row, text='Latency: \u2014', font=('Consolas', 10),
-                           fg='#aaaaaa', bg='#1a1d1f')
-        lat_lbl.pack(side='left', padx=(0, 20))
-
-        jit_lbl = tk.Label(stats_row, text='Jitter: \u2014', font=('Consolas', 10),
-                           fg='#aaaaaa', bg='#1a1d1f')
-        jit_lbl.pack(side='left', padx=(0, 20))
-
-        rate_lbl = tk.Label(stats_row, text='Rate: \u2014', font=('Consolas', 10),
-                            fg='#aaaaaa', bg='#1a1d1f')
-        rate_lbl.pack(side='left', padx=(0, 20))
-
-        seq_lbl = tk.Label(stats_row, text='Seq: \u2014', font=('Consolas', 10),
-                           fg='#666666', bg='#1a1d1f')
-        seq_lbl.pack(side='right')
-
-        self._player_cards[cid] = {
-            'frame': card,
-            'name_lbl': name_lbl,
-            'lat_lbl': lat_lbl,
-            'jit_lbl': jit_lbl,
-            'rate_lbl': rate_lbl,
-            'seq_lbl': seq_lbl,
-            'slot_badge': slot_badge,
-            'color': color,
-        }
+        stats_y = y0 + 54
+        self._player_lat_items[i] = c.create_text(
+            x0 + 16, stats_y, anchor='w', font=FONT_MONO, tags=(tag,))
+        self._player_jit_items[i] = c.create_text(
+            x0 + 186, stats_y, anchor='w', font=FONT_MONO, fill='#aaaaaa', tags=(tag,))
+        self._player_rate_items[i] = c.create_text(
+            x0 + 336, stats_y, anchor='w', font=FONT_MONO, fill='#aaaaaa', tags=(tag,))
+        self._player_seq_items[i] = c.create_text(
+            x1 - 16, stats_y, anchor='e', font=FONT_MONO, fill='#666666', tags=(tag, right_tag))
+        c.itemconfigure(tag, state='hidden')
 
-    def _update_player_card(self, cid: int, name: str, color: str, slot: int,
-                            latency: str, jitter: str, rate: str, seq: str):
-        """Update an existing player card with new stats."""
-        if cid not in self._player_cards:
-            self._create_player_card(cid, name, color, slot)
-        card = self._player_cards.get(cid)
-        if card is None:
+    def _create_player_card(self, cid: int, name: str, color: str, slot: int):
+        """Show the player card for a slot, styled for the player who joined it."""
+        i = slot - 1
+        if not 0 <= i < MAX_PLAYERS or self._player_cids[i] == cid:
             return
-        try:
-            lat_f = float(latency)
-            # Color-code latency
-            if lat_f < 10:
-                lat_color = '#22c55e'  # green
-            elif lat_f < 30:
-                lat_color = '#f59e0b'  # amber
-            else:
-                lat_color = '#ef4444'  # red
-            card['lat_lbl'].config(text=f'Latency: {latency} ms', fg=lat_color)
-            card['jit_lbl'].config(text=f'Jitter: {jitter} ms')
-            rate_f = float(rate)
-            if rate_f > 0:
-                card['rate_lbl'].config(text=f'Rate: {rate} Hz')
-            card['seq_lbl'].config(text=f'Seq: {seq}')
-        except Exception:
-            pass
-
-    def _remove_player_card(self, cid: int):
-        """Remove a player card from the Monitor tab."""
-        card = self._player_cards.pop(cid, None)
-        if card is not None:
-            try:
-                card['frame'].destroy()
-            except Exception:
-                pass
-        # Show empty label if no players left
-        if not self._player_cards:
-            try:
-                self._monitor_empty_label.pack(expand=True, pady=80)
-            except Exception:
-                pass
-
-    def _log_monitor_event(self, text: str, color: str = '#aaaaaa'):
-        """Append a line to the monitor event log."""
-        try:
-            import time as _t
-            ts = _t.strftime('%H:%M:%S')
-            self._monitor_log.config(state='normal')
-            tag_name = f'c_{color.replace("#", "")}'
-            self._monitor_log.tag_configure(tag_name, foreground=color)
-            self._monitor_log.insert('end', f'[{ts}] {text}\n', tag_name)
-            self._monitor_log.see('end')
-            self._monitor_log.config(state='disabled')
-        except Exception:
-            pass
+        c = self._monitor_canvas
+        # Hide the empty-state text
+        c.itemconfigure(self._monitor_empty_item, state='hidden')
+
+        c.itemconfigure(self._player_rects[i], outline=color)
+        c.itemconfigure(self._player_dot_items[i], fill=color, outline=color)
+        c.itemconfigure(self._player_name_items[i], text=name, fill=color)
+        c.itemconfigure(self._player_badge_rects[i], fill=color, outline=color)
+        # A slot reassigned before we saw the previous player leave starts fresh too
+        c.itemconfigure(self._player_lat_items[i], text='Latency: \u2014', fill='#aaaaaa')
+        c.itemconfigure(self._player_jit_items[i], text='Jitter: \u2014')
+        c.itemconfigure(self._player_rate_items[i], text='Rate: \u2014')
+        c.itemconfigure(self._player_seq_items[i], text='Seq: \u2014')
+        c.itemconfigure(f'slot{slot}', state='normal')
+
+        self._player_cids[i] = cid
+        self._player_last[i] = [None, None, None, None]
+        c.configure(scrollregion=c.bbox('all'))
+
+    def _on_monitor_resize(self, event):
+        """Stretch the player cards and re-center the empty text to the canvas width."""
+        width = max(event.width, 2 * self._CARD_MARGIN + 480)
+        dx = width - self._monitor_width
+        self._monitor_width = width
+        c = self._monitor_canvas
+        c.coords(self._monitor_empty_item, width // 2, 80)
+        if dx:
+            for i, rect in enumerate(self._player_rects):
+                x0, y0, x1, y1 = c.coords(rect)
+                c.coords(rect, x0, y0, x1 + dx, y1)
+                c.move(f'slot{i + 1}_right', dx, 0)
+
+    def _update_player_card(self, slot: int, latency: float, jitter: float, rate: float, seq: int):
+        """Update the stats on the existing player card; unchanged items are not touched."""
+        i = slot - 1
+        c = self._monitor_canvas
+        last = self._player_last[i]
+        lat = (f'Latency: {latency:.1f} ms', self._LAT_COLORS[(latency >= 10) + (latency >= 30)])
+        if lat != last[0]:
+            c.itemconfigure(self._player_lat_items[i], text=lat[0], fill=lat[1])
+            last[0] = lat
+        # Jitter is NaN until the host has two latency samples
+        if not math.isnan(jitter):
+            jit = f'Jitter: {jitter:.1f} ms'
+            if jit != last[1]:
+                c.itemconfigure(self._player_jit_items[i], text=jit)
+                last[1] = jit
+        if rate > 0:
+            rate_text = f'Rate: {rate:.1f} Hz'
+            if rate_text != last[2]:
+                c.itemconfigure(self._player_rate_items[i], text=rate_text)
+                last[2] = rate_text
+        seq_text = f'Seq: {seq}'
+        if seq_text != last[3]:
+            c.itemconfigure(self._player_seq_items[i], text=seq_text)
+            last[3] = seq_text
+
+    def _remove_player_card(self, slot: int):
+        """Hide the player card in the given slot on the Monitor tab."""
+        i = slot - 1
+        if not 0 <= i < MAX_PLAYERS:
+            return
+        c = self._monitor_canvas
+        if self._player_cids[i] is not None:
+            c.itemconfigure(f'slot{slot}', state='hidden')
+            self._player_cids[i] = None
+            self._player_last[i] = None
+        # Show empty text if no players left
+        if all(pc is None for pc in self._player_cids):
+            c.itemconfigure(self._monitor_empty_item, state='normal')
+        c.configure(scrollregion=c.bbox('all'))
+
+    def _log_monitor_event(self, text: str, tag=()):
+        """Append a line to the monitor event log, colored by a preconfigured tag."""
+        # Events arrive in bursts; format the timestamp once per wall-clock second
+        now = int(time.time())
+        if now != self._log_ts_sec:
+            self._log_ts_sec = now
+            self._log_ts = time.strftime('%H:%M:%S', time.localtime(now))
+        self._append_text(self._monitor_log, f'[{self._log_ts}] {text}', tag)
 
 
 def main():
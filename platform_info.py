@@ -2,32 +2,74 @@
 Platform detection and compatibility information module.
 Provides user-friendly status messages about platform capabilities.
 """
+import importlib.util
 import sys
-import platform
+import threading
+
+
+# Static text returned by PlatformInfo; tuples so callers can't alter the shared copy
+_WINDOWS_NOTES = (
+    'Supports multiple Windows clients',
+    'ViGEmBus creates Xbox 360 controllers recognized by all games',
+)
+_WINDOWS_HOST_SETUP = (
+    '1. Download ViGEmBus installer from GitHub',
+    '2. Run installer with administrator privileges',
+    '3. Restart application after installation',
+    '4. Allow Python through Windows Firewall',
+)
+_WINDOWS_CLIENT_SETUP = (
+    '1. Install pygame: pip install pygame',
+    '2. Connect USB gamepad (optional)',
+    '3. Allow Python through Windows Firewall',
+)
+_UNSUPPORTED_SETUP = ('Platform not fully supported',)
 
 
 class PlatformInfo:
     """Detect platform capabilities and provide user-friendly messages."""
     
     def __init__(self):
+        # Imported here rather than at module level: importing this module is on
+        # the app's startup path, while instances are built on a worker thread
+        import platform
         self.os_name = platform.system()
         self.is_windows = sys.platform == 'win32'
         self.is_macos = sys.platform == 'darwin'
+        # Probes and status lookups run on both the Tk thread and worker threads;
+        # re-entrant because get_compatibility_info reads the other statuses
+        self._lock = threading.RLock()
         
         # Check virtual gamepad support
         self._check_capabilities()
     
     def _check_capabilities(self):
         """Check what virtual gamepad capabilities are available."""
-        self.vgamepad_available = False
-        
         # Check for Windows vgamepad
         try:
             import vgamepad
-            self.vgamepad_available = True
+            vgamepad_available = True
         except ImportError:
-            pass
+            vgamepad_available = False
+
+        # Check for pygame (client gamepad input). Only locate it: importing
+        # pygame initialises SDL and prints its banner, and the client does
+        # that itself when it starts
+        pygame_available = importlib.util.find_spec('pygame') is not None
+
+        # Publish the flags together, so no status is ever built from a half-done probe
+        with self._lock:
+            self.vgamepad_available = vgamepad_available
+            self.pygame_available = pygame_available
+            # Status dicts are derived from the flags above; rebuilt on next request
+            self._host_status = None
+            self._client_status = None
+            self._compat_info = None
     
+    def refresh(self):
+        """Re-run capability detection, e.g. after a driver has been installed."""
+        self._check_capabilities()
+
     def get_platform_name(self):
         """Get user-friendly platform name."""
         if self.is_windows:
@@ -39,6 +81,12 @@ class PlatformInfo:
     
     def get_host_status(self):
         """Get host capability status with user-friendly message."""
+        with self._lock:
+            if self._host_status is None:
+                self._host_status = self._build_host_status()
+            return self._host_status
+
+    def _build_host_status(self):
         if self.is_windows:
             if self.vgamepad_available:
                 return {
@@ -68,13 +116,13 @@ class PlatformInfo:
     
     def get_client_status(self):
         """Get client capability status with user-friendly message."""
-        try:
-            import pygame
-            pygame_available = True
-        except ImportError:
-            pygame_available = False
-        
-        if pygame_available:
+        with self._lock:
+            if self._client_status is None:
+                self._client_status = self._build_client_status()
+            return self._client_status
+
+    def _build_client_status(self):
+        if self.pygame_available:
             return {
                 'status': 'ready',
                 'icon': '✓',
@@ -94,6 +142,12 @@ class PlatformInfo:
     
     def get_compatibility_info(self):
         """Get cross-platform compatibility information."""
+        with self._lock:
+            if self._compat_info is None:
+                self._compat_info = self._build_compatibility_info()
+            return self._compat_info
+
+    def _build_compatibility_info(self):
         host_ok = self.get_host_status()['status'] in ['ready', 'warning']
         client_ok = self.get_client_status()['status'] in ['ready', 'warning']
         
@@ -105,42 +159,27 @@ class PlatformInfo:
         
         # Platform compatibility notes
         if self.is_windows:
-            info['notes'] = [
-                'Supports multiple Windows clients',
-                'ViGEmBus creates Xbox 360 controllers recognized by all games'
-            ]
+            info['notes'] = _WINDOWS_NOTES
         
         return info
     
     def get_setup_instructions(self):
         """Get platform-specific setup instructions."""
         if self.is_windows:
-            return {
-                'host': [
-                    '1. Download ViGEmBus installer from GitHub',
-                    '2. Run installer with administrator privileges',
-                    '3. Restart application after installation',
-                    '4. Allow Python through Windows Firewall'
-                ],
-                'client': [
-                    '1. Install pygame: pip install pygame',
-                    '2. Connect USB gamepad (optional)',
-                    '3. Allow Python through Windows Firewall'
-                ]
-            }
+            return {'host': _WINDOWS_HOST_SETUP, 'client': _WINDOWS_CLIENT_SETUP}
         else:
-            return {
-                'host': ['Platform not fully supported'],
-                'client': ['Platform not fully supported']
-            }
+            return {'host': _UNSUPPORTED_SETUP, 'client': _UNSUPPORTED_SETUP}
 
 
 # Global instance
 _platform_info = None
+_platform_info_lock = threading.Lock()
 
 def get_platform_info():
     """Get global platform info instance."""
     global _platform_info
     if _platform_info is None:
-        _platform_info = PlatformInfo()
+        with _platform_info_lock:
+            if _platform_info is None:
+                _platform_info = PlatformInfo()
     return _platform_info
@@ -45,9 +45,8 @@ class PlatformChecker:
         # Network functionality
         results['checks']['network'] = self._check_network()
         
-        # Host/Client functionality
-        results['checks']['host'] = self._check_host_functionality()
-        results['checks']['client'] = self._check_client_functionality()
+        # Host/Client functionality, against each other over loopback
+        results['checks']['host'], results['checks']['client'] = self._check_host_client()
         
         return results
     
@@ -114,65 +113,63 @@ class PlatformChecker:
             self.issues.append(('ERROR', 'Network', msg))
             return {'status': 'error', 'message': str(e)}
     
-    def _check_host_functionality(self) -> Dict:
-        """Test host can start and bind to port"""
+    def _check_host_client(self) -> Tuple[Dict, Dict]:
+        """Run a loopback host/client pair: host can bind, client can send to it"""
+        msgs = []
+        host = client = None
+        host_error = client_error = None
         try:
             from gp.core.host import GamepadHost
-            
-            # Create a test host
-            msgs = []
-            def capture(msg):
-                msgs.append(msg)
-            
-            host = GamepadHost(bind_ip='127.0.0.1', port=17777, status_cb=capture)
+            host = GamepadHost(bind_ip='127.0.0.1', port=17777, status_cb=msgs.append)
             host.start()
-            time.sleep(0.5)
-            host.stop()
             time.sleep(0.3)
-            
-            # Check if it started successfully
-            if any('listening' in m.lower() for m in msgs):
-                print("✓ Host: Can start and bind to port")
-                return {'status': 'ok', 'message': 'Host functional'}
-            else:
-                msg = "Host started but no listening message"
-                print(f"⚠ Host: {msg}")
-                return {'status': 'warning', 'message': msg}
         except Exception as e:
-            msg = f"Host start failed: {e}"
-            print(f"✗ Host: {msg}")
-            self.issues.append(('ERROR', 'Host', msg))
-            return {'status': 'error', 'message': str(e)}
-    
-    def _check_client_functionality(self) -> Dict:
-        """Test client can send packets"""
+            host_error = e
+        
         try:
             from gp.core.client import GamepadClient
-            
-            # Create a test client
-            msgs = []
-            def capture(msg):
-                msgs.append(msg)
-            
-            client = GamepadClient(target_ip='127.0.0.1', port=17778, status_cb=capture)
+            client = GamepadClient(target_ip='127.0.0.1', port=17777, status_cb=msgs.append)
             client.start()
             time.sleep(0.3)
-            client.stop()
-            time.sleep(0.2)
-            
-            # Check if it started successfully
-            if any('sending' in m.lower() for m in msgs):
-                print("✓ Client: Can send packets")
-                return {'status': 'ok', 'message': 'Client functional'}
-            else:
-                msg = "Client started but no sending message"
-                print(f"⚠ Client: {msg}")
-                return {'status': 'warning', 'message': msg}
         except Exception as e:
-            msg = f"Client start failed: {e}"
+            client_error = e
+        finally:
+            if client is not None:
+                client.stop()
+            if host is not None:
+                host.stop()
+        time.sleep(0.2)
+        
+        return (self._host_result(msgs, host_error),
+                self._client_result(msgs, client_error))
+    
+    def _host_result(self, msgs: List[str], error) -> Dict:
+        """Check the host started and bound to its port"""
+        if error is not None:
+            msg = f"Host start failed: {error}"
+            print(f"✗ Host: {msg}")
+            self.issues.append(('ERROR', 'Host', msg))
+            return {'status': 'error', 'message': str(error)}
+        if any('listening' in m.lower() for m in msgs):
+            print("✓ Host: Can start and bind to port")
+            return {'status': 'ok', 'message': 'Host functional'}
+        msg = "Host started but no listening message"
+        print(f"⚠ Host: {msg}")
+        return {'status': 'warning', 'message': msg}
+    
+    def _client_result(self, msgs: List[str], error) -> Dict:
+        """Check the client started sending packets"""
+        if error is not None:
+            msg = f"Client start failed: {error}"
             print(f"✗ Client: {msg}")
             self.issues.append(('ERROR', 'Client', msg))
-            return {'status': 'error', 'message': str(e)}
+            return {'status': 'error', 'message': str(error)}
+        if any('sending' in m.lower() for m in msgs):
+            print("✓ Client: Can send packets")
+            return {'status': 'ok', 'message': 'Client functional'}
+        msg = "Client started but no sending message"
+        print(f"⚠ Client: {msg}")
+        return {'status': 'warning', 'message': msg}
     
     def print_summary(self):
         """Print summary of issues"""
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the settings file helpers in main.py.
+
+These exercise load_config/save_config against a temporary config
+directory; no window is created.
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main as app
+
+
+def _with_temp_config(test):
+    """Run test(config_path) with main's config files redirected to a temp dir."""
+    saved = (app.CONFIG_DIR, app.CONFIG_PATH, app._config_on_disk)
+    with tempfile.TemporaryDirectory() as tmp:
+        app.CONFIG_DIR = os.path.join(tmp, '.coopad')
+        app.CONFIG_PATH = os.path.join(app.CONFIG_DIR, 'settings.json')
+        app._config_on_disk = None
+        try:
+            test(app.CONFIG_PATH)
+        finally:
+            app.CONFIG_DIR, app.CONFIG_PATH, app._config_on_disk = saved
+
+
+def test_save_and_load():
+    """Test settings round-trip through an atomic write."""
+    print("Testing save/load round-trip...")
+
+    def run(path):
+        assert app.load_config() == {}, "Missing file should load as empty settings"
+
+        cfg = {'update_rate': 60, 'controller_profile': 'xbox360'}
+        app.save_config(cfg)
+        assert os.path.exists(path), "Settings file should be created"
+        assert not os.path.exists(path + '.tmp'), "Temp file should be renamed into place"
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f) == cfg, "File should hold the saved settings"
+        assert app.load_config() == cfg, "Saved settings should load back"
+
+    _with_temp_config(run)
+    print("✓ Round-trip works\n")
+
+
+def test_skip_unchanged():
+    """Test unchanged settings are not rewritten."""
+    print("Testing unchanged settings skip the write...")
+
+    def run(path):
+        cfg = {'update_rate': 60}
+        app.save_config(cfg)
+        inode = os.stat(path).st_ino
+
+        # Each real write replaces the file, so an unchanged inode means no write
+        app.save_config(dict(cfg))
+        assert os.stat(path).st_ino == inode, "Unchanged settings should not be rewritten"
+
+        cfg['update_rate'] = 120
+        app.save_config(cfg)
+        assert os.stat(path).st_ino != inode, "Changed settings should replace the file"
+        assert app.load_config() == cfg, "Changed settings should be on disk"
+
+        # Settings just loaded from disk count as unchanged too
+        inode = os.stat(path).st_ino
+        app.save_config(app.load_config())
+        assert os.stat(path).st_ino == inode, "Loaded settings should not be rewritten"
+
+    _with_temp_config(run)
+    print("✓ Unchanged settings skipped\n")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Settings File Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_save_and_load()
+        test_skip_unchanged()
+
+        print("=" * 60)
+        print("✓ ALL SETTINGS TESTS PASSED")
+        print("=" * 60)
+        return 0
+    except Exception as e:
+        print("\n" + "=" * 60)
+        print(f"✗ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,12 +3,18 @@
 Simulated cross-platform integration test
 Tests various scenarios including cross-platform client-host connections
 """
+import math
 import sys
 import time
 import threading
 from gp.core.host import GamepadHost
 from gp.core.client import GamepadClient
-from gp.core.protocol import make_state_from_inputs, pack, unpack
+from gp.core.protocol import (
+    make_state_from_inputs, pack, unpack,
+    pack_player_stats, unpack_player_stats, TELEM_PLAYER_STATS,
+    pack_player_event, unpack_player_event, TELEM_PLAYER_JOIN, TELEM_PLAYER_LEAVE, PLAYER_COLORS,
+    pack_link_stats, unpack_link_stats, TELEM_LINK_STATS, LINK_ROLE_CLIENT
+)
 
 
 def test_host_client_local():
@@ -248,6 +254,74 @@ def test_host_timeout():
     print("  ✓ Test passed - Ownership timeout works")
 
 
+def test_player_frames():
+    """Test binary player telemetry frame encoding/decoding"""
+    print("\n=== Test 8: Player Telemetry Frames ===")
+    
+    frame = pack_player_stats(client_id=4242, slot=3, latency_ms=12.5, jitter_ms=0.75,
+                              rate_hz=60.0, seq=0x1FFFF)
+    assert frame[0] == TELEM_PLAYER_STATS, "Frame kind mismatch"
+    
+    cid, slot, latency, jitter, rate, seq = unpack_player_stats(frame)
+    assert cid == 4242, "Client ID mismatch"
+    assert slot == 3, "Slot mismatch"
+    assert abs(latency - 12.5) < 1e-6, "Latency mismatch"
+    assert abs(jitter - 0.75) < 1e-6, "Jitter mismatch"
+    assert abs(rate - 60.0) < 1e-6, "Rate mismatch"
+    assert seq == 0xFFFF, "Sequence should wrap to 16 bits"
+    
+    # Join/leave frames carry a color index and a variable-length name
+    color_idx = len(PLAYER_COLORS) - 1
+    frame = pack_player_event(TELEM_PLAYER_JOIN, 4242, 3, color_idx, 'Crimson Fox')
+    assert frame[0] == TELEM_PLAYER_JOIN, "Event kind mismatch"
+    assert unpack_player_event(frame) == (4242, 3, color_idx, 'Crimson Fox'), "Event fields mismatch"
+    
+    # Single-gamepad link stats carry the measuring side instead of a slot
+    frame = pack_link_stats(LINK_ROLE_CLIENT, 4.25, 0.5, 90, 0x10001)
+    assert frame[0] == TELEM_LINK_STATS, "Link stats kind mismatch"
+    assert unpack_link_stats(frame) == (LINK_ROLE_CLIENT, 4.25, 0.5, 90.0, 1), "Link stats fields mismatch"
+    jitter = unpack_link_stats(pack_link_stats(LINK_ROLE_CLIENT, 4.25, float('nan'), 60, 1))[2]
+    assert math.isnan(jitter), "Unmeasured (NaN) jitter should survive the frame"
+    
+    print("  ✓ Test passed")
+
+
+def test_slot_reuse():
+    """Test multi-gamepad hosts hand out the lowest free player slot"""
+    print("\n=== Test 9: Player Slot Reuse ===")
+    
+    frames = []
+    host = GamepadHost(status_cb=lambda m: print(f"  HOST: {m}"), telemetry_cb=frames.append,
+                       multi_gamepad=True)
+    
+    def slots():
+        return {cid: info['slot'] for cid, info in host._clients.items()}
+    
+    for cid in (101, 102, 103):
+        host._get_or_create_gamepad(cid)
+    assert slots() == {101: 1, 102: 2, 103: 3}, "Clients should fill slots in join order"
+    
+    # Player 2 times out
+    host._clients[102]['last_time'] -= 11.0
+    host._cleanup_stale_clients()
+    assert slots() == {101: 1, 103: 3}, "Stale client should be removed"
+    assert frames[-1][0] == TELEM_PLAYER_LEAVE, "Leave frame should be sent"
+    assert unpack_player_event(frames[-1])[:2] == (102, 2), "Leave frame should name the freed slot"
+    
+    # A new client takes the freed slot, the next one the slot after the last
+    host._get_or_create_gamepad(104)
+    assert slots()[104] == 2, "Rejoining client should reuse the lowest free slot"
+    host._get_or_create_gamepad(105)
+    assert slots()[105] == 4, "Next client should take the remaining slot"
+    assert unpack_player_event(frames[-1])[:2] == (105, 4), "Join frame should carry the slot"
+    
+    # All slots taken: further clients are rejected
+    host._get_or_create_gamepad(106)
+    assert 106 not in slots(), "Clients beyond MAX_CONTROLLERS should be rejected"
+    
+    print("  ✓ Test passed")
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -262,6 +336,8 @@ def main():
         test_host_client_local,
         test_multiple_clients,
         test_host_timeout,
+        test_player_frames,
+        test_slot_reuse,
     ]
     
     passed = 0